@@ -13,6 +13,7 @@ License: MIT
 """
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 
 # Ensure the package can be imported when running directly
@@ -22,13 +23,13 @@ if __name__ == "__main__":
     if str(parent) not in sys.path:
         sys.path.insert(0, str(parent))
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QSplashScreen
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPalette, QColor
+from PySide6.QtGui import QFont, QPalette, QColor, QPixmap
 
 from pdf_consolidator.core.sanitize import setup_logging
 from pdf_consolidator.core.settings import get_app_data_dir, get_log_path
-from pdf_consolidator.ui.main_window import MainWindow
+# MainWindow is imported in main() once the splash screen is up
 
 
 def configure_high_dpi():
@@ -76,6 +77,20 @@ def create_application() -> QApplication:
     return app
 
 
+def create_splash_screen() -> QSplashScreen:
+    """Create a plain splash screen shown while the main window loads."""
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(QColor("#f8f9fa"))
+
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "PDF Consolidator\nLoading...",
+        Qt.AlignCenter,
+        QColor("#212529")
+    )
+    return splash
+
+
 def main():
     """Main entry point for the application."""
     # Configure high DPI before creating application
@@ -91,9 +106,17 @@ def main():
     # Create Qt application
     app = create_application()
 
+    # Paint a splash before pulling in the main window and its dependencies
+    splash = create_splash_screen()
+    splash.show()
+    app.processEvents()
+
+    from pdf_consolidator.ui.main_window import MainWindow
+
     # Create and show main window
     window = MainWindow()
     window.show()
+    splash.finish(window)
 
     logger.info("Main window displayed")
 
@@ -109,4 +132,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the spawned merge process in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -3,13 +3,17 @@ PDF merging service for PDF Consolidator.
 
 Handles the core merge logic without any Qt dependencies for testability.
 """
+import logging
+import multiprocessing
 import os
-import shutil
+import queue
 import tempfile
+import threading
 import time
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Callable, Dict
+from typing import List, Optional, Callable, Dict, Tuple
 
 from pypdf import PdfWriter, PdfReader
 from pypdf.errors import PdfReadError
@@ -19,8 +23,8 @@ from .models import (
     QueuedPDF, FileStatus, MergeResult, MergeProgress,
     MergeManifestEntry, EncryptionHandlingMode
 )
-from .pdf_probe import validate_and_update_queued_pdf, HAS_PYMUPDF
-from .sanitize import get_logger, sanitize_path_for_log
+from .pdf_probe import iter_validate_queue
+from .sanitize import get_logger, sanitize_path_for_log, setup_logging
 from .utils import generate_output_filename, find_unique_path, compute_sha256
 
 
@@ -33,6 +37,24 @@ ProgressCallback = Callable[[MergeProgress], None]
 # Password request callback: (filename) -> (password, use_for_all, cancelled)
 PasswordRequestCallback = Callable[[str], tuple]
 
+# Number of files parsed ahead of the writer (also the read worker count)
+READ_AHEAD_FILES = min(os.cpu_count() or 1, 4)
+
+# Buffer size for writing the merged output
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of files hashed concurrently when compute_hashes is enabled
+HASH_WORKERS = 4
+
+# Minimum seconds between routine progress updates
+PROGRESS_INTERVAL = 0.05
+
+# Per-file fields a subprocess merge copies back onto the caller's queue
+_MERGE_STATE_FIELDS = (
+    'status', 'status_message', 'skip_reason', 'page_count',
+    'sha256_hash', 'is_encrypted', 'password_provided',
+)
+
 
 class MergeService:
     """
@@ -59,11 +81,27 @@ class MergeService:
             compute_hashes: Compute SHA256 hashes for audit
         """
         self.normalize_metadata = normalize_metadata
-        self.encryption_mode = encryption_mode
+        self.encryption_mode = encryption_mode  # Also picks _password_strategy
         self.generate_report = generate_report
         self.compute_hashes = compute_hashes
         self._cancelled = False
         self._shared_password: Optional[str] = None
+        self._last_progress_ts = 0.0
+
+    @property
+    def encryption_mode(self) -> EncryptionHandlingMode:
+        """How encrypted PDFs are handled during merge."""
+        return self._encryption_mode
+
+    @encryption_mode.setter
+    def encryption_mode(self, mode: EncryptionHandlingMode) -> None:
+        # Resolve the password strategy once instead of per encrypted file
+        self._encryption_mode = mode
+        self._password_strategy = {
+            EncryptionHandlingMode.SKIP: self._password_skip,
+            EncryptionHandlingMode.SINGLE_PASSWORD: self._password_single,
+            EncryptionHandlingMode.PROMPT_EACH: self._password_each,
+        }.get(mode, self._password_skip)
 
     def cancel(self) -> None:
         """Request cancellation of current merge operation."""
@@ -78,6 +116,103 @@ class MergeService:
         """Set password to use for all encrypted PDFs."""
         self._shared_password = password
 
+    def merge_in_subprocess(
+        self,
+        files: List[QueuedPDF],
+        output_path: Path,
+        progress_callback: Optional[ProgressCallback] = None,
+        passwords: Optional[Dict[str, str]] = None
+    ) -> MergeResult:
+        """
+        Run merge() in a child process so pypdf work never holds this
+        process's GIL.
+
+        Blocks until the child finishes, forwarding its progress updates to
+        progress_callback. cancel() is relayed to the child. Per-file
+        results are copied back onto the given QueuedPDF objects. Passwords
+        can't be prompted for across the process boundary, so they must be
+        supplied up front (passwords or set_shared_password()).
+
+        Args:
+            files: List of QueuedPDF objects to merge
+            output_path: Path for output file
+            progress_callback: Optional callback for progress updates
+            passwords: Optional dict mapping file paths to passwords
+
+        Returns:
+            MergeResult with details of the operation
+        """
+        self._cancelled = False
+        ctx = multiprocessing.get_context('spawn')
+        messages = ctx.Queue()
+        cancel_event = ctx.Event()
+        options = {
+            'normalize_metadata': self.normalize_metadata,
+            'encryption_mode': self.encryption_mode,
+            'generate_report': self.generate_report,
+            'compute_hashes': self.compute_hashes,
+        }
+
+        # Mirror this process's logging setup (if any) in the child
+        log_config = None
+        if logger.handlers:
+            log_file = next(
+                (h.baseFilename for h in logger.handlers
+                 if isinstance(h, logging.FileHandler)),
+                None
+            )
+            log_config = (logger.level, log_file)
+
+        process = ctx.Process(
+            target=_run_merge_process,
+            args=(
+                options, self._shared_password, files, output_path,
+                passwords or {}, messages, cancel_event, log_config
+            ),
+            name="pdf-merge",
+            daemon=True
+        )
+        process.start()
+
+        result = None
+        try:
+            while result is None:
+                if self._cancelled:
+                    cancel_event.set()
+                try:
+                    message = messages.get(timeout=0.1)
+                except queue.Empty:
+                    if process.is_alive():
+                        continue
+                    # The child may have exited just after queueing its result
+                    try:
+                        message = messages.get(timeout=1.0)
+                    except queue.Empty:
+                        break
+
+                kind = message[0]
+                if kind == 'progress':
+                    if progress_callback:
+                        progress_callback(message[1])
+                elif kind == 'result':
+                    result, file_states = message[1], message[2]
+                    for queued_pdf, state in zip(files, file_states):
+                        for name, value in zip(_MERGE_STATE_FIELDS, state):
+                            setattr(queued_pdf, name, value)
+                elif kind == 'error':
+                    result = MergeResult(success=False, error_message=message[1])
+        finally:
+            process.join(timeout=5)
+            messages.close()
+
+        if result is None:
+            logger.error(f"Merge process exited with code {process.exitcode}")
+            result = MergeResult(
+                success=False,
+                error_message="Merge process exited unexpectedly"
+            )
+        return result
+
     def validate_files(
         self,
         files: List[QueuedPDF],
@@ -93,23 +228,35 @@ class MergeService:
         Returns:
             List of updated QueuedPDF objects with validation results
         """
-        total = len(files)
         skip_encrypted = self.encryption_mode == EncryptionHandlingMode.SKIP
 
-        for i, queued_pdf in enumerate(files):
+        # Probe each distinct path once; repeats copy the first result
+        first_by_path: Dict[str, QueuedPDF] = {}
+        for queued_pdf in files:
+            first_by_path.setdefault(str(queued_pdf.file_path), queued_pdf)
+        unique = list(first_by_path.values())
+
+        total = len(unique)
+        for i, queued_pdf in iter_validate_queue(unique, skip_encrypted):
             if self._cancelled:
                 break
 
-            if progress_callback:
-                progress_callback(MergeProgress(
-                    current_file=queued_pdf.file_name,
-                    current_index=i + 1,
-                    total_files=total,
-                    percent_complete=(i / total) * 100,
-                    status_message=f"Validating {queued_pdf.file_name}..."
-                ))
+            self._emit_progress(
+                progress_callback,
+                current_file=queued_pdf.file_name,
+                current_index=i + 1,
+                total_files=total,
+                percent_complete=((i + 1) / total) * 100,
+                status_message=f"Validated {queued_pdf.file_name}",
+                force=i == 0 or i == total - 1
+            )
 
-            validate_and_update_queued_pdf(queued_pdf, skip_encrypted)
+        for queued_pdf in files:
+            first = first_by_path[str(queued_pdf.file_path)]
+            if first is not queued_pdf:
+                queued_pdf.status = first.status
+                queued_pdf.status_message = first.status_message
+                queued_pdf.page_count = first.page_count
 
         return files
 
@@ -132,20 +279,27 @@ class MergeService:
             password_request_callback: Callback to request password from user
 
         Returns:
-            MergeResult with details of the operation
+            MergeResult with details of the operation (manifest entries are
+            only populated when generate_report is enabled)
         """
         self._cancelled = False
         start_time = time.time()
         passwords = passwords or {}
-        manifest_entries: List[MergeManifestEntry] = []
+        # One slot per queued file, filled in queue order. The manifest is
+        # only consumed by the summary report, so skip it when that's off.
+        build_manifest = self.generate_report
+        manifest_entries: List[Optional[MergeManifestEntry]] = (
+            [None] * len(files) if build_manifest else []
+        )
 
         safe_output = sanitize_path_for_log(output_path)
         logger.info(f"Starting merge of {len(files)} files to {safe_output}")
 
-        # Filter to valid files only
-        valid_files = [f for f in files if f.is_valid_for_merge]
+        # Check validity once per file; the loop below reuses the mask
+        valid_mask = [f.is_valid_for_merge for f in files]
+        valid_count = sum(valid_mask)
 
-        if not valid_files:
+        if valid_count == 0:
             return MergeResult(
                 success=False,
                 error_message="No valid PDF files to merge",
@@ -164,130 +318,192 @@ class MergeService:
         skipped_count = 0
         error_count = 0
 
-        # Process each file in order
+        # Parse upcoming files on worker threads so file reads overlap with
+        # page appending. Readers are still consumed strictly in queue order.
+        executor = ThreadPoolExecutor(
+            max_workers=READ_AHEAD_FILES,
+            thread_name_prefix="pdf-read"
+        )
+        upcoming = (i for i, valid in enumerate(valid_mask) if valid)
+        reader_futures: Dict[int, Future] = {}
+
+        # A path queued more than once is parsed once and its reader shared;
+        # the shared entry is dropped after the path's last occurrence
+        path_keys = [str(f.file_path) for f in files]
+        remaining_uses = Counter(
+            key for key, valid in zip(path_keys, valid_mask) if valid
+        )
+        shared_reads: Dict[str, Future] = {}
+        decrypted_keys = set()
+
+        def schedule_reads() -> None:
+            while len(reader_futures) < READ_AHEAD_FILES:
+                index = next(upcoming, None)
+                if index is None:
+                    return
+                key = path_keys[index]
+                future = shared_reads.get(key)
+                if future is None:
+                    future = executor.submit(PdfReader, files[index].file_path)
+                    shared_reads[key] = future
+                reader_futures[index] = future
+
+        schedule_reads()
+
+        # Hash every file up front on its own pool; hashlib releases the GIL
+        # so this overlaps with the page appending below
+        hash_executor = None
+        hash_futures: Dict[str, Future] = {}
+        if self.compute_hashes:
+            hash_executor = ThreadPoolExecutor(
+                max_workers=HASH_WORKERS,
+                thread_name_prefix="pdf-hash"
+            )
+            for key, f in zip(path_keys, files):
+                if key not in hash_futures:
+                    hash_futures[key] = hash_executor.submit(
+                        compute_sha256, f.file_path
+                    )
+
+        # Sanitize every path once up front for the log statements below
+        safe_paths = [sanitize_path_for_log(f.file_path) for f in files]
+
+        # Process each file in order, with hot-loop lookups bound to locals
         total = len(files)
-        for i, queued_pdf in enumerate(files):
-            if self._cancelled:
-                logger.info("Merge cancelled by user")
-                result.error_message = "Merge cancelled"
-                return result
+        log_info = logger.info
+        log_warning = logger.warning
+        append_document = writer.append
+        emit_progress = self._emit_progress
+        compute_hashes = self.compute_hashes
+        try:
+            for i, queued_pdf in enumerate(files):
+                if self._cancelled:
+                    log_info("Merge cancelled by user")
+                    result.error_message = "Merge cancelled"
+                    return result
 
-            safe_path = sanitize_path_for_log(queued_pdf.file_path)
+                safe_path = safe_paths[i]
 
-            if progress_callback:
-                progress_callback(MergeProgress(
+                emit_progress(
+                    progress_callback,
                     current_file=queued_pdf.file_name,
                     current_index=i + 1,
                     total_files=total,
                     percent_complete=((i + 1) / total) * 80,  # Reserve 20% for writing
-                    status_message=f"Merging {queued_pdf.file_name}..."
-                ))
-
-            # Compute hash if enabled
-            if self.compute_hashes:
-                try:
-                    queued_pdf.sha256_hash = compute_sha256(queued_pdf.file_path)
-                except Exception as e:
-                    logger.warning(f"Failed to compute hash for {safe_path}: {e}")
-
-            # Skip files that aren't valid for merge
-            if not queued_pdf.is_valid_for_merge:
-                manifest_entries.append(self._create_manifest_entry(
-                    i + 1, queued_pdf
-                ))
-                if queued_pdf.status not in (FileStatus.PENDING, FileStatus.READY):
-                    skipped_count += 1
-                continue
-
-            try:
-                queued_pdf.status = FileStatus.PROCESSING
-
-                # Open and read PDF
-                reader = PdfReader(queued_pdf.file_path)
-
-                # Handle encryption
-                if reader.is_encrypted:
-                    queued_pdf.is_encrypted = True
-                    password = self._get_password_for_file(
-                        queued_pdf,
-                        passwords,
-                        password_request_callback
-                    )
-
-                    if password is None:
-                        # Skip - no password available
-                        queued_pdf.status = FileStatus.ENCRYPTED
-                        queued_pdf.skip_reason = "skipped"
-                        queued_pdf.status_message = "Skipped"
-                        skipped_count += 1
-                        manifest_entries.append(self._create_manifest_entry(
-                            i + 1, queued_pdf
-                        ))
-                        logger.info(f"Skipped encrypted file: {safe_path}")
-                        continue
+                    status_message=f"Merging {queued_pdf.file_name}...",
+                    force=i == 0 or i == total - 1
+                )
 
-                    # Try to decrypt
+                # Collect hash if enabled
+                if compute_hashes:
                     try:
-                        decrypt_result = reader.decrypt(password)
-                        if not decrypt_result:
-                            queued_pdf.status = FileStatus.ENCRYPTED
-                            queued_pdf.skip_reason = "password failed"
-                            queued_pdf.status_message = "Wrong password"
-                            skipped_count += 1
-                            manifest_entries.append(self._create_manifest_entry(
-                                i + 1, queued_pdf
-                            ))
-                            logger.info(f"Password failed for: {safe_path}")
-                            continue
-                        queued_pdf.password_provided = True
+                        queued_pdf.sha256_hash = hash_futures[path_keys[i]].result()
                     except Exception as e:
-                        queued_pdf.status = FileStatus.ENCRYPTED
-                        queued_pdf.skip_reason = "decrypt error"
-                        queued_pdf.status_message = "Decrypt failed"
-                        skipped_count += 1
-                        manifest_entries.append(self._create_manifest_entry(
-                            i + 1, queued_pdf
-                        ))
-                        logger.warning(f"Decrypt error for {safe_path}: {e}")
+                        log_warning(f"Failed to compute hash for {safe_path}: {e}")
+
+                try:
+                    # Skip files that aren't valid for merge
+                    if not valid_mask[i]:
+                        if queued_pdf.status not in (FileStatus.PENDING, FileStatus.READY):
+                            skipped_count += 1
                         continue
 
-                # Add pages to writer
-                pages_added = 0
-                for page in reader.pages:
-                    writer.add_page(page)
-                    pages_added += 1
-                    total_pages += 1
-
-                queued_pdf.status = FileStatus.MERGED
-                queued_pdf.page_count = pages_added
-                queued_pdf.status_message = ""
-                queued_pdf.skip_reason = ""
-                merged_count += 1
-
-                manifest_entries.append(self._create_manifest_entry(
-                    i + 1, queued_pdf
-                ))
-                logger.info(f"Merged {pages_added} pages from {safe_path}")
-
-            except PdfReadError as e:
-                queued_pdf.status = FileStatus.CORRUPT
-                queued_pdf.status_message = "Corrupt or unreadable"
-                queued_pdf.skip_reason = "corrupt"
-                error_count += 1
-                manifest_entries.append(self._create_manifest_entry(
-                    i + 1, queued_pdf
-                ))
-                logger.warning(f"Failed to read PDF {safe_path}: {e}")
+                    try:
+                        queued_pdf.status = FileStatus.PROCESSING
+
+                        # Collect the reader parsed ahead of time
+                        key = path_keys[i]
+                        reader_future = reader_futures.pop(i)
+                        remaining_uses[key] -= 1
+                        if not remaining_uses[key]:
+                            del shared_reads[key]
+                        schedule_reads()
+                        reader = reader_future.result()
+
+                        # Handle encryption (a shared reader stays decrypted)
+                        if reader.is_encrypted and key in decrypted_keys:
+                            queued_pdf.is_encrypted = True
+                            queued_pdf.password_provided = True
+                        elif reader.is_encrypted:
+                            queued_pdf.is_encrypted = True
+                            password = self._get_password_for_file(
+                                queued_pdf,
+                                passwords,
+                                password_request_callback
+                            )
+
+                            if password is None:
+                                # Skip - no password available
+                                queued_pdf.status = FileStatus.ENCRYPTED
+                                queued_pdf.skip_reason = "skipped"
+                                queued_pdf.status_message = "Skipped"
+                                skipped_count += 1
+                                log_info(f"Skipped encrypted file: {safe_path}")
+                                continue
+
+                            # Try to decrypt
+                            try:
+                                decrypt_result = reader.decrypt(password)
+                                if not decrypt_result:
+                                    queued_pdf.status = FileStatus.ENCRYPTED
+                                    queued_pdf.skip_reason = "password failed"
+                                    queued_pdf.status_message = "Wrong password"
+                                    skipped_count += 1
+                                    log_info(f"Password failed for: {safe_path}")
+                                    continue
+                                queued_pdf.password_provided = True
+                                decrypted_keys.add(key)
+                            except Exception as e:
+                                queued_pdf.status = FileStatus.ENCRYPTED
+                                queued_pdf.skip_reason = "decrypt error"
+                                queued_pdf.status_message = "Decrypt failed"
+                                skipped_count += 1
+                                log_warning(f"Decrypt error for {safe_path}: {e}")
+                                continue
+
+                        # Append the whole document in one pass; the reader is
+                        # already parsed (and decrypted), so don't reopen by path
+                        pages_added = len(reader.pages)
+                        append_document(reader, import_outline=False)
+                        total_pages += pages_added
+
+                        queued_pdf.status = FileStatus.MERGED
+                        queued_pdf.page_count = pages_added
+                        queued_pdf.status_message = ""
+                        queued_pdf.skip_reason = ""
+                        merged_count += 1
+
+                        log_info(f"Merged {pages_added} pages from {safe_path}")
+
+                    except PdfReadError as e:
+                        queued_pdf.status = FileStatus.CORRUPT
+                        queued_pdf.status_message = "Corrupt or unreadable"
+                        queued_pdf.skip_reason = "corrupt"
+                        error_count += 1
+                        log_warning(f"Failed to read PDF {safe_path}: {e}")
 
-            except Exception as e:
-                queued_pdf.status = FileStatus.ERROR
-                queued_pdf.status_message = str(e)[:50]
-                queued_pdf.skip_reason = "error"
-                error_count += 1
-                manifest_entries.append(self._create_manifest_entry(
-                    i + 1, queued_pdf
-                ))
-                logger.error(f"Error processing {safe_path}: {e}")
+                    except Exception as e:
+                        queued_pdf.status = FileStatus.ERROR
+                        queued_pdf.status_message = str(e)[:50]
+                        queued_pdf.skip_reason = "error"
+                        error_count += 1
+                        logger.error(f"Error processing {safe_path}: {e}")
+                finally:
+                    # Every file gets a manifest entry, whichever way it went
+                    if build_manifest:
+                        manifest_entries[i] = MergeManifestEntry(
+                            index=i + 1,
+                            file_name=queued_pdf.file_name,
+                            full_path=str(queued_pdf.file_path),
+                            size_bytes=queued_pdf.size_bytes,
+                            page_count=queued_pdf.page_count,
+                            status=queued_pdf.manifest_status,
+                            sha256_hash=queued_pdf.sha256_hash
+                        )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            if hash_executor is not None:
+                hash_executor.shutdown(wait=False, cancel_futures=True)
 
         # Check if we have anything to write
         if merged_count == 0:
@@ -308,35 +524,39 @@ class MergeService:
 
         # Write output atomically (to temp file, then rename)
         try:
-            if progress_callback:
-                progress_callback(MergeProgress(
-                    current_file="",
-                    current_index=total,
-                    total_files=total,
-                    percent_complete=90,
-                    status_message="Writing output file..."
-                ))
+            self._emit_progress(
+                progress_callback,
+                current_file="",
+                current_index=total,
+                total_files=total,
+                percent_complete=90,
+                status_message="Writing output file...",
+                force=True
+            )
 
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write to temp file first
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.pdf')
-            temp_path = Path(temp_path)
-            # Close the file descriptor immediately - we'll reopen with open()
-            os.close(temp_fd)
-
+            # Write to a temp file beside the output so the final rename
+            # stays on one volume and is atomic
+            temp_path = None
             try:
-                with open(temp_path, 'wb') as f:
+                with tempfile.NamedTemporaryFile(
+                    dir=output_path.parent,
+                    suffix='.pdf.tmp',
+                    delete=False,
+                    buffering=WRITE_BUFFER_SIZE
+                ) as f:
+                    temp_path = Path(f.name)
                     writer.write(f)
 
                 # Move to final location
-                shutil.move(str(temp_path), str(output_path))
+                os.replace(temp_path, output_path)
                 logger.info(f"Output written to {safe_output}")
 
             except Exception as e:
                 # Clean up temp file on error
-                if temp_path.exists():
+                if temp_path is not None and temp_path.exists():
                     temp_path.unlink()
                 raise OutputWriteError(f"Failed to write output: {e}", str(output_path))
 
@@ -346,6 +566,12 @@ class MergeService:
             logger.error(f"Write error: {e}")
             return result
 
+        # Stat the output once for both the report and the result
+        try:
+            output_size = os.stat(output_path).st_size
+        except FileNotFoundError:
+            output_size = 0
+
         # Generate summary report with manifest
         if self.generate_report:
             self._write_summary_report(
@@ -355,12 +581,12 @@ class MergeService:
                 merged_count,
                 skipped_count,
                 error_count,
-                total_pages
+                total_pages,
+                output_size
             )
 
         # Calculate final result
         duration = time.time() - start_time
-        output_size = output_path.stat().st_size if output_path.exists() else 0
 
         result.success = True
         result.merged_count = merged_count
@@ -371,14 +597,15 @@ class MergeService:
         result.duration_seconds = duration
         result.manifest_entries = manifest_entries
 
-        if progress_callback:
-            progress_callback(MergeProgress(
-                current_file="",
-                current_index=total,
-                total_files=total,
-                percent_complete=100,
-                status_message="Complete!"
-            ))
+        self._emit_progress(
+            progress_callback,
+            current_file="",
+            current_index=total,
+            total_files=total,
+            percent_complete=100,
+            status_message="Complete!",
+            force=True
+        )
 
         logger.info(
             f"Merge complete: {merged_count} merged, {skipped_count} skipped, "
@@ -387,6 +614,38 @@ class MergeService:
 
         return result
 
+    def _emit_progress(
+        self,
+        progress_callback: Optional[ProgressCallback],
+        current_file: str,
+        current_index: int,
+        total_files: int,
+        percent_complete: float,
+        status_message: str,
+        force: bool = False
+    ) -> None:
+        """
+        Report progress, throttled to one update per PROGRESS_INTERVAL.
+
+        Forced updates (first/last file, write phase, completion) are
+        always delivered.
+        """
+        if progress_callback is None:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_progress_ts < PROGRESS_INTERVAL:
+            return
+        self._last_progress_ts = now
+
+        progress_callback(MergeProgress(
+            current_file=current_file,
+            current_index=current_index,
+            total_files=total_files,
+            percent_complete=percent_complete,
+            status_message=status_message
+        ))
+
     def _get_password_for_file(
         self,
         queued_pdf: QueuedPDF,
@@ -404,54 +663,51 @@ class MergeService:
         if file_key in passwords:
             return passwords[file_key]
 
-        # Handle based on encryption mode
-        if self.encryption_mode == EncryptionHandlingMode.SKIP:
-            return None
-
-        elif self.encryption_mode == EncryptionHandlingMode.SINGLE_PASSWORD:
-            # Use shared password if set
-            if self._shared_password is not None:
-                return self._shared_password
-            # Request password once
-            if password_request_callback:
-                password, use_for_all, cancelled = password_request_callback(
-                    queued_pdf.file_name
-                )
-                if cancelled:
-                    return None
-                if use_for_all:
-                    self._shared_password = password
-                return password
-            return None
-
-        elif self.encryption_mode == EncryptionHandlingMode.PROMPT_EACH:
-            # Request password for each file
-            if password_request_callback:
-                password, _, cancelled = password_request_callback(
-                    queued_pdf.file_name
-                )
-                if cancelled:
-                    return None
-                return password
-            return None
+        return self._password_strategy(queued_pdf, password_request_callback)
+
+    def _password_skip(
+        self,
+        queued_pdf: QueuedPDF,
+        password_request_callback: Optional[PasswordRequestCallback]
+    ) -> Optional[str]:
+        """SKIP mode: never supply a password."""
+        return None
 
+    def _password_single(
+        self,
+        queued_pdf: QueuedPDF,
+        password_request_callback: Optional[PasswordRequestCallback]
+    ) -> Optional[str]:
+        """SINGLE_PASSWORD mode: reuse the shared password once known."""
+        # Use shared password if set
+        if self._shared_password is not None:
+            return self._shared_password
+        # Request password once
+        if password_request_callback:
+            password, use_for_all, cancelled = password_request_callback(
+                queued_pdf.file_name
+            )
+            if cancelled:
+                return None
+            if use_for_all:
+                self._shared_password = password
+            return password
         return None
 
-    def _create_manifest_entry(
+    def _password_each(
         self,
-        index: int,
-        queued_pdf: QueuedPDF
-    ) -> MergeManifestEntry:
-        """Create a manifest entry for a queued PDF."""
-        return MergeManifestEntry(
-            index=index,
-            file_name=queued_pdf.file_name,
-            full_path=str(queued_pdf.file_path),
-            size_bytes=queued_pdf.size_bytes,
-            page_count=queued_pdf.page_count,
-            status=queued_pdf.manifest_status,
-            sha256_hash=queued_pdf.sha256_hash
-        )
+        queued_pdf: QueuedPDF,
+        password_request_callback: Optional[PasswordRequestCallback]
+    ) -> Optional[str]:
+        """PROMPT_EACH mode: request a password for each file."""
+        if password_request_callback:
+            password, _, cancelled = password_request_callback(
+                queued_pdf.file_name
+            )
+            if cancelled:
+                return None
+            return password
+        return None
 
     def _write_summary_report(
         self,
@@ -461,45 +717,53 @@ class MergeService:
         merged_count: int,
         skipped_count: int,
         error_count: int,
-        total_pages: int
+        total_pages: int,
+        output_size: int
     ) -> None:
         """Write a summary report with merge manifest alongside the output PDF."""
         report_path = output_path.with_suffix('.txt')
 
         try:
+            parts: List[str] = [
+                "=" * 70 + "\n",
+                "PDF Consolidator - Merge Summary Report\n",
+                "=" * 70 + "\n\n",
+
+                f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"Output file: {output_path.name}\n",
+                f"Output path: {output_path}\n\n",
+
+                "-" * 70 + "\n",
+                "SUMMARY\n",
+                "-" * 70 + "\n",
+                f"  Files merged:  {merged_count}\n",
+                f"  Files skipped: {skipped_count}\n",
+                f"  Errors:        {error_count}\n",
+                f"  Total pages:   {total_pages}\n",
+            ]
+            if output_size:
+                parts.append(
+                    f"  Output size:   {output_size:,} bytes ({output_size/1024/1024:.2f} MB)\n"
+                )
+            parts.append("\n")
+
+            # Merge Manifest section
+            parts.append("=" * 70 + "\n")
+            parts.append("MERGE MANIFEST\n")
+            parts.append("(Files listed in exact merge order)\n")
+            parts.append("=" * 70 + "\n\n")
+
+            include_hash = self.compute_hashes
+            for entry in manifest_entries:
+                parts.append(entry.to_manifest_line(include_hash=include_hash))
+                parts.append("\n")
+
+            parts.append("-" * 70 + "\n")
+            parts.append("End of Report\n")
+
+            # Encode and write the whole report in one call
             with open(report_path, 'w', encoding='utf-8') as f:
-                f.write("=" * 70 + "\n")
-                f.write("PDF Consolidator - Merge Summary Report\n")
-                f.write("=" * 70 + "\n\n")
-
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Output file: {output_path.name}\n")
-                f.write(f"Output path: {output_path}\n\n")
-
-                f.write("-" * 70 + "\n")
-                f.write("SUMMARY\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"  Files merged:  {merged_count}\n")
-                f.write(f"  Files skipped: {skipped_count}\n")
-                f.write(f"  Errors:        {error_count}\n")
-                f.write(f"  Total pages:   {total_pages}\n")
-                if output_path.exists():
-                    output_size = output_path.stat().st_size
-                    f.write(f"  Output size:   {output_size:,} bytes ({output_size/1024/1024:.2f} MB)\n")
-                f.write("\n")
-
-                # Merge Manifest section
-                f.write("=" * 70 + "\n")
-                f.write("MERGE MANIFEST\n")
-                f.write("(Files listed in exact merge order)\n")
-                f.write("=" * 70 + "\n\n")
-
-                for entry in manifest_entries:
-                    f.write(entry.to_manifest_line(include_hash=self.compute_hashes))
-                    f.write("\n")
-
-                f.write("-" * 70 + "\n")
-                f.write("End of Report\n")
+                f.write("".join(parts))
 
             logger.info(f"Summary report written to {sanitize_path_for_log(report_path)}")
 
@@ -507,6 +771,52 @@ class MergeService:
             logger.warning(f"Failed to write summary report: {e}")
 
 
+def _run_merge_process(
+    options: Dict,
+    shared_password: Optional[str],
+    files: List[QueuedPDF],
+    output_path: Path,
+    passwords: Dict[str, str],
+    messages,
+    cancel_event,
+    log_config: Optional[Tuple[int, Optional[str]]] = None
+) -> None:
+    """Child-process entry point for MergeService.merge_in_subprocess."""
+    if log_config is not None:
+        log_level, log_file = log_config
+        setup_logging(
+            log_level=log_level,
+            log_file=Path(log_file) if log_file else None
+        )
+
+    try:
+        service = MergeService(**options)
+        if shared_password is not None:
+            service.set_shared_password(shared_password)
+
+        # Relay cancellation from the parent without polling in the merge loop
+        def watch_cancel() -> None:
+            cancel_event.wait()
+            service.cancel()
+
+        threading.Thread(target=watch_cancel, daemon=True).start()
+
+        result = service.merge(
+            files,
+            output_path,
+            progress_callback=lambda p: messages.put(('progress', p)),
+            passwords=passwords
+        )
+        file_states = [
+            tuple(getattr(f, name) for name in _MERGE_STATE_FIELDS)
+            for f in files
+        ]
+        messages.put(('result', result, file_states))
+    except Exception as e:
+        logger.exception("Merge process error")
+        messages.put(('error', str(e)))
+
+
 def create_merge_service(
     normalize_metadata: bool = True,
     encryption_mode: EncryptionHandlingMode = EncryptionHandlingMode.SKIP,
@@ -1,12 +1,15 @@
 """
 Data models for PDF Consolidator.
 """
+import os
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
+from .utils import normalize_path
+
 
 class FileStatus(Enum):
     """Status of a queued PDF file."""
@@ -21,6 +24,29 @@ class FileStatus(Enum):
     ERROR = auto()        # Other error
 
 
+# Display names for each status (built once, not per status_display call)
+_STATUS_NAMES = {
+    FileStatus.PENDING: "Pending",
+    FileStatus.READY: "Ready",
+    FileStatus.PROCESSING: "Processing...",
+    FileStatus.MERGED: "Merged",
+    FileStatus.SKIPPED: "Skipped",
+    FileStatus.ENCRYPTED: "Encrypted",
+    FileStatus.CORRUPT: "Corrupt",
+    FileStatus.NOT_PDF: "Not a PDF",
+    FileStatus.ERROR: "Error",
+}
+
+# Manifest text for statuses whose wording doesn't depend on the file
+_FIXED_MANIFEST_STATUS = {
+    FileStatus.MERGED: "Merged",
+    FileStatus.CORRUPT: "Skipped - corrupt/unreadable",
+    FileStatus.NOT_PDF: "Skipped - not a PDF",
+    FileStatus.PENDING: "Pending",
+    FileStatus.READY: "Pending",
+}
+
+
 class EncryptionHandlingMode(Enum):
     """How to handle encrypted PDFs."""
     SKIP = auto()              # Skip all encrypted PDFs
@@ -35,7 +61,7 @@ class SortMode(Enum):
     MODIFIED_TIME = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedPDF:
     """Represents a PDF file in the merge queue."""
 
@@ -47,26 +73,41 @@ class QueuedPDF:
     status: FileStatus = FileStatus.PENDING
     status_message: str = ""
     skip_reason: str = ""  # Detailed reason when skipped
-    modified_time: Optional[datetime] = None
+    mtime: float = 0.0  # st_mtime; see modified_time
     sha256_hash: Optional[str] = None
+    content_hash: Optional[str] = None  # See utils.compute_content_hash
     is_encrypted: bool = False
     password_provided: bool = False  # True if user provided password
+    # Last ellipsized_path result as (file_path, max_length, text)
+    _ellipsized: Optional[Tuple[Path, int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Last normalized_path result as (file_path, text)
+    _normalized: Optional[Tuple[Path, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize computed fields."""
         if not self.file_name:
             self.file_name = self.file_path.name
-        if self.size_bytes == 0 and self.file_path.exists():
+        if self.size_bytes == 0 or not self.mtime:
+            # One stat covers both fields; a missing file just leaves defaults
             try:
-                self.size_bytes = self.file_path.stat().st_size
+                st = os.stat(self.file_path)
             except OSError:
-                pass
-        if self.modified_time is None and self.file_path.exists():
-            try:
-                mtime = self.file_path.stat().st_mtime
-                self.modified_time = datetime.fromtimestamp(mtime)
-            except OSError:
-                pass
+                return
+            if self.size_bytes == 0:
+                self.size_bytes = st.st_size
+            if not self.mtime:
+                self.mtime = st.st_mtime
+
+    @property
+    def modified_time(self) -> Optional[datetime]:
+        """Get modification time as a datetime (built on demand from mtime)."""
+        if not self.mtime:
+            return None
+        return datetime.fromtimestamp(self.mtime)
 
     @property
     def size_mb(self) -> float:
@@ -76,12 +117,13 @@ class QueuedPDF:
     @property
     def size_display(self) -> str:
         """Get human-readable file size."""
-        if self.size_bytes < 1024:
-            return f"{self.size_bytes} B"
-        elif self.size_bytes < 1024 * 1024:
-            return f"{self.size_bytes / 1024:.1f} KB"
-        else:
-            return f"{self.size_mb:.2f} MB"
+        size = self.size_bytes
+        if size < 1024:
+            return f"{size} B"
+        # Below 1 MiB iff the value fits in 20 bits
+        if size.bit_length() <= 20:
+            return f"{size / 1024:.1f} KB"
+        return f"{size / 1048576:.2f} MB"
 
     @property
     def page_count_display(self) -> str:
@@ -93,18 +135,7 @@ class QueuedPDF:
     @property
     def status_display(self) -> str:
         """Get human-readable status."""
-        status_names = {
-            FileStatus.PENDING: "Pending",
-            FileStatus.READY: "Ready",
-            FileStatus.PROCESSING: "Processing...",
-            FileStatus.MERGED: "Merged",
-            FileStatus.SKIPPED: "Skipped",
-            FileStatus.ENCRYPTED: "Encrypted",
-            FileStatus.CORRUPT: "Corrupt",
-            FileStatus.NOT_PDF: "Not a PDF",
-            FileStatus.ERROR: "Error",
-        }
-        base = status_names.get(self.status, "Unknown")
+        base = _STATUS_NAMES.get(self.status, "Unknown")
         if self.status_message:
             return f"{base}: {self.status_message}"
         return base
@@ -112,22 +143,17 @@ class QueuedPDF:
     @property
     def manifest_status(self) -> str:
         """Get status for merge manifest (more detailed)."""
-        if self.status == FileStatus.MERGED:
-            return "Merged"
+        fixed = _FIXED_MANIFEST_STATUS.get(self.status)
+        if fixed is not None:
+            return fixed
         elif self.status == FileStatus.SKIPPED:
             return f"Skipped - {self.skip_reason or 'user choice'}"
         elif self.status == FileStatus.ENCRYPTED:
             if self.skip_reason:
                 return f"Encrypted - {self.skip_reason}"
             return "Encrypted - skipped"
-        elif self.status == FileStatus.CORRUPT:
-            return "Skipped - corrupt/unreadable"
-        elif self.status == FileStatus.NOT_PDF:
-            return "Skipped - not a PDF"
         elif self.status == FileStatus.ERROR:
             return f"Error - {self.status_message or 'unknown'}"
-        elif self.status in (FileStatus.PENDING, FileStatus.READY):
-            return "Pending"
         return self.status_display
 
     @property
@@ -135,15 +161,42 @@ class QueuedPDF:
         """Check if file can be included in merge."""
         return self.status in (FileStatus.PENDING, FileStatus.READY)
 
+    @property
+    def normalized_path(self) -> str:
+        """Normalized path string for duplicate checks (cached until file_path changes)."""
+        cached = self._normalized
+        if cached is not None and cached[0] is self.file_path:
+            return cached[1]
+        normalized = str(normalize_path(self.file_path))
+        self._normalized = (self.file_path, normalized)
+        return normalized
+
     def ellipsized_path(self, max_length: int = 50) -> str:
-        """Get ellipsized path for display."""
-        path_str = str(self.file_path.parent)
-        if len(path_str) <= max_length:
-            return path_str
-        return "..." + path_str[-(max_length - 3):]
+        """Get ellipsized path for display (cached until file_path changes)."""
+        cached = self._ellipsized
+        if (
+            cached is not None
+            and cached[0] is self.file_path
+            and cached[1] == max_length
+        ):
+            return cached[2]
+
+        # Slice the parent out of the path string instead of building a Path
+        path_str = os.fspath(self.file_path)
+        sep = path_str.rfind(os.sep)
+        if sep < 0:
+            path_str = "."
+        elif sep == 0 or path_str[sep - 1] == ":":
+            path_str = path_str[:sep + 1]  # Keep the separator of a root
+        else:
+            path_str = path_str[:sep]
+        if len(path_str) > max_length:
+            path_str = "..." + path_str[-(max_length - 3):]
+        self._ellipsized = (self.file_path, max_length, path_str)
+        return path_str
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeManifestEntry:
     """Entry in the merge manifest for audit trail."""
     index: int
@@ -165,7 +218,7 @@ class MergeManifestEntry:
         return line
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of a merge operation."""
 
@@ -193,7 +246,7 @@ class MergeResult:
         return f"Merge failed: {self.error_message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeProgress:
     """Progress update during merge operation."""
 
@@ -4,8 +4,13 @@ PDF validation and probing for PDF Consolidator.
 Provides safe PDF validation without loading full file content into memory.
 Uses pypdf as primary library, with optional PyMuPDF for better page count detection.
 """
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from .errors import (
     PDFValidationError,
@@ -15,13 +20,7 @@ from .errors import (
 )
 from .models import QueuedPDF, FileStatus
 from .sanitize import get_logger, sanitize_path_for_log
-
-# Check for PyMuPDF availability
-try:
-    import fitz  # PyMuPDF
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
+from .utils import RAW_READ_FLAGS
 
 # pypdf is required
 from pypdf import PdfReader
@@ -31,28 +30,126 @@ from pypdf.errors import PdfReadError, FileNotDecryptedError
 logger = get_logger()
 
 
-def is_pdf_file(file_path: Path) -> bool:
+@lru_cache(maxsize=None)
+def _get_fitz():
     """
-    Quick check if a file appears to be a PDF based on magic bytes.
+    Import PyMuPDF on first use.
 
-    Args:
-        file_path: Path to file to check
+    Loading its shared libraries is a noticeable startup cost, and many
+    sessions never get past the fast structure probe, so it is only
+    imported when a probe or decrypt actually falls back to it.
 
     Returns:
-        True if file starts with PDF magic bytes
+        The fitz module, or None if PyMuPDF isn't installed
     """
     try:
-        with open(file_path, 'rb') as f:
-            header = f.read(8)
-            return header.startswith(b'%PDF-')
-    except (IOError, OSError):
-        return False
+        import fitz  # PyMuPDF
+    except ImportError:
+        return None
+    return fitz
+
+# Header every PDF file starts with
+_PDF_MAGIC = b'%PDF-'
+
+# Bytes scanned at either end of a file by the fast page-count path
+_SCAN_WINDOW = 2048
+
+_ROOT_REF_RE = re.compile(rb'/Root\s+(\d+)\s+(\d+)\s+R')
+_PAGES_REF_RE = re.compile(rb'/Pages\s+(\d+)\s+(\d+)\s+R')
+_COUNT_RE = re.compile(rb'/Count\s+(\d+)(?!\d)(?!\s+\d+\s+R)')
+_LINEARIZED_N_RE = re.compile(rb'/N\s+(\d+)')
+_LINEARIZED_L_RE = re.compile(rb'/L\s+(\d+)')
+_STARTXREF_RE = re.compile(rb'startxref\s+(\d+)')
+_XREF_SECTION_RE = re.compile(rb'\s*(\d+)[ \t]+(\d+)[ \t]*\r?\n')
+_XREF_ENTRY_RE = re.compile(rb'(\d{10}) (\d{5}) ([nf])')
+_TRAILER_RE = re.compile(rb'\s*trailer')
+_OBJ_HEADER_RE = re.compile(rb'\s*(\d+)\s+(\d+)\s+obj')
+
+# Size of one classic xref table entry, end-of-line included
+_XREF_ENTRY_SIZE = 20
+
+
+def _os_error_message(error: OSError) -> str:
+    """Status message for a file that couldn't be opened or stat'ed."""
+    if isinstance(error, FileNotFoundError):
+        return "File not found"
+    return error.strerror or type(error).__name__
+
+
+def _prepare_one(file_path: Path, order_index: int) -> QueuedPDF:
+    """Build a QueuedPDF from one open: fstat plus a 5-byte header read."""
+    try:
+        fd = os.open(file_path, RAW_READ_FLAGS)
+        try:
+            st = os.fstat(fd)
+            magic = os.read(fd, len(_PDF_MAGIC))
+        finally:
+            os.close(fd)
+    except OSError as e:
+        # Queued anyway, so the user sees why the file won't be merged
+        return QueuedPDF(
+            file_path=file_path,
+            order_index=order_index,
+            file_name=file_path.name,
+            status=FileStatus.ERROR,
+            status_message=_os_error_message(e)
+        )
+
+    queued = QueuedPDF(
+        file_path=file_path,
+        order_index=order_index,
+        file_name=file_path.name,
+        size_bytes=st.st_size,
+        mtime=st.st_mtime
+    )
+    if magic != _PDF_MAGIC:
+        queued.status = FileStatus.NOT_PDF
+        queued.status_message = "Not a valid PDF"
+    return queued
+
+
+def prepare_queue(
+    paths: List[Path],
+    start_index: int = 0,
+    max_workers: Optional[int] = None
+) -> List[QueuedPDF]:
+    """
+    Build QueuedPDFs for a batch of paths on a thread pool.
+
+    Each file is opened once for its stat and header, and the opens
+    overlap across workers, so adding many files (especially from a
+    network share) costs roughly one round trip rather than several per
+    file. Files that don't exist or can't be opened are queued with an
+    ERROR status saying why.
+
+    Args:
+        paths: Files to queue
+        start_index: order_index of the first file
+        max_workers: Worker count (default: up to 8)
+
+    Returns:
+        QueuedPDFs in input order, with non-PDFs already marked NOT_PDF
+        and unreadable files marked ERROR
+    """
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or min(8, len(paths)),
+        thread_name_prefix="pdf-prepare"
+    ) as executor:
+        return list(executor.map(
+            _prepare_one, paths, range(start_index, start_index + len(paths))
+        ))
 
 
 def probe_pdf(file_path: Path, check_encryption: bool = True) -> Tuple[bool, Optional[int], str]:
     """
     Probe a PDF file to check validity and get page count.
 
+    Results are cached per (path, size, mtime), so re-probing an unchanged
+    file skips the parse; any modification changes the key.
+
     Args:
         file_path: Path to PDF file
         check_encryption: Whether to check for encryption
@@ -61,56 +158,223 @@ def probe_pdf(file_path: Path, check_encryption: bool = True) -> Tuple[bool, Opt
         Tuple of (is_valid, page_count, error_message)
         page_count is None if couldn't be determined
     """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return False, None, "File not found"
+    except OSError:
+        return False, None, "Not a PDF file"
+
+    return _probe_pdf_cached(
+        str(file_path), st.st_size, st.st_mtime_ns, check_encryption
+    )
+
+
+@lru_cache(maxsize=4096)
+def _probe_pdf_cached(
+    path_str: str,
+    size: int,
+    mtime_ns: int,
+    check_encryption: bool
+) -> Tuple[bool, Optional[int], str]:
+    """Cached probe; size and mtime_ns only serve as the cache key."""
+    return _probe_pdf_uncached(Path(path_str), check_encryption)
+
+
+probe_pdf.cache_clear = _probe_pdf_cached.cache_clear
+
+
+def _read_xref_table(buf, offset: int) -> Optional[Tuple[List[Tuple[int, int, int]], bytes]]:
+    """
+    Parse the classic xref table at offset.
+
+    Returns (first, count, entries_pos) for each subsection plus the trailer
+    dictionary text, or None if offset doesn't hold a well-formed table
+    (xref streams included).
+    """
+    if buf[offset:offset + 4] != b'xref':
+        return None
+    pos = offset + 4
+    sections = []
+    while True:
+        header = _XREF_SECTION_RE.match(buf, pos)
+        if header is None:
+            break
+        first, count = int(header.group(1)), int(header.group(2))
+        sections.append((first, count, header.end()))
+        pos = header.end() + count * _XREF_ENTRY_SIZE
+    trailer = _TRAILER_RE.match(buf, pos)
+    if trailer is None:
+        return None
+    stop = buf.find(b'startxref', trailer.end())
+    if stop < 0:
+        return None
+    return sections, bytes(buf[trailer.end():stop])
+
+
+def _find_object_body(buf, sections, num: int, gen: int) -> Optional[bytes]:
+    """Return the text of object 'num gen' at the offset the xref table gives."""
+    for first, count, entries_pos in reversed(sections):
+        if not first <= num < first + count:
+            continue
+        entry = _XREF_ENTRY_RE.match(buf, entries_pos + (num - first) * _XREF_ENTRY_SIZE)
+        if entry is None or entry.group(3) != b'n' or int(entry.group(2)) != gen:
+            return None
+        header = _OBJ_HEADER_RE.match(buf, int(entry.group(1)))
+        if header is None or (int(header.group(1)), int(header.group(2))) != (num, gen):
+            return None
+        stop = buf.find(b'endobj', header.end())
+        if stop < 0:
+            return None
+        return bytes(buf[header.end():stop])
+    return None
+
+
+def _fast_page_count(buf) -> Optional[int]:
+    """
+    Read the page count straight from a PDF's structure without a parser.
+
+    Uses the linearization dictionary when it still describes the whole
+    file, otherwise follows trailer /Root -> /Pages -> /Count through the
+    xref table. Returns None whenever the answer isn't certain (encrypted
+    files, xref streams and object streams, incremental updates, damaged
+    tails, ...) so the caller can fall back to a full parse.
+    """
+    size = len(buf)
+    tail = bytes(buf[-_SCAN_WINDOW:])
+    if b'%%EOF' not in tail:
+        return None
+    offsets = _STARTXREF_RE.findall(tail)
+    if not offsets:
+        return None
+
+    # Encryption has to be reported by the real parsers; /Encrypt sits in
+    # the trailer, or in the xref stream dictionary startxref points at
+    offset = int(offsets[-1])
+    if offset >= size:
+        return None
+    if b'/Encrypt' in tail or b'/Encrypt' in buf[offset:offset + _SCAN_WINDOW]:
+        return None
+
+    # Linearized files carry the page count up front, but only trust it if
+    # the file hasn't been incrementally updated since (/L is the length)
+    head = bytes(buf[:_SCAN_WINDOW])
+    lin = head.find(b'/Linearized')
+    if lin >= 0:
+        lin_dict = head[lin:head.find(b'>>', lin)]
+        length = _LINEARIZED_L_RE.search(lin_dict)
+        pages = _LINEARIZED_N_RE.search(lin_dict)
+        if length and pages and int(length.group(1)) == size:
+            return int(pages.group(1))
+
+    # Only a single classic xref table lists every object: /Prev chains to
+    # older sections (incremental updates, linearized files) and /XRefStm
+    # to an xref stream whose objects may sit in object streams
+    xref = _read_xref_table(buf, offset)
+    if xref is None:
+        return None
+    sections, trailer = xref
+    if b'/Prev' in trailer or b'/XRefStm' in trailer:
+        return None
+
+    root_ref = _ROOT_REF_RE.search(trailer)
+    if root_ref is None:
+        return None
+    root = _find_object_body(buf, sections, int(root_ref.group(1)), int(root_ref.group(2)))
+    if root is None:
+        return None
+
+    pages_ref = _PAGES_REF_RE.search(root)
+    if pages_ref is None:
+        return None
+    pages = _find_object_body(buf, sections, int(pages_ref.group(1)), int(pages_ref.group(2)))
+    if pages is None:
+        return None
+
+    count = _COUNT_RE.search(pages)
+    if count is None:
+        return None
+    return int(count.group(1))
+
+
+def _probe_pdf_uncached(
+    file_path: Path,
+    check_encryption: bool
+) -> Tuple[bool, Optional[int], str]:
+    """Open and parse a PDF to check validity and get page count."""
     safe_path = sanitize_path_for_log(file_path)
 
-    # Check file exists
-    if not file_path.exists():
+    # One handle for the magic-byte check, the structure scan and pypdf;
+    # nothing reads the whole file into memory
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
         return False, None, "File not found"
-
-    # Check if it's actually a PDF
-    if not is_pdf_file(file_path):
+    except OSError:
         return False, None, "Not a PDF file"
 
-    # Try to get page count with PyMuPDF first (faster and more robust)
-    if HAS_PYMUPDF:
+    with f:
         try:
-            doc = fitz.open(file_path)
-            if doc.is_encrypted and not doc.authenticate(""):
-                doc.close()
-                return False, None, "PDF is encrypted"
-            page_count = doc.page_count
-            doc.close()
-            logger.debug(f"Probed PDF with PyMuPDF: {safe_path}, pages={page_count}")
-            return True, page_count, ""
-        except Exception as e:
-            # Fall through to pypdf
-            logger.debug(f"PyMuPDF failed, falling back to pypdf: {e}")
+            # Check if it's actually a PDF
+            if f.read(len(_PDF_MAGIC)) != _PDF_MAGIC:
+                return False, None, "Not a PDF file"
 
-    # Fall back to pypdf
-    try:
-        reader = PdfReader(file_path)
-
-        # Check encryption
-        if check_encryption and reader.is_encrypted:
-            # Try empty password
+            # Fast path: map the file and read the page count from its
+            # structure, touching only the few pages of the file it needs
             try:
-                if not reader.decrypt(""):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    page_count = _fast_page_count(mm)
+            except (OSError, ValueError):
+                page_count = None
+            if page_count is not None:
+                logger.debug(f"Probed PDF structure: {safe_path}, pages={page_count}")
+                return True, page_count, ""
+        except OSError:
+            return False, None, "Not a PDF file"
+
+        # Try to get page count with PyMuPDF first (faster and more robust).
+        # Opened by path: MuPDF reads the parts it needs from the file itself
+        fitz = _get_fitz()
+        if fitz is not None:
+            try:
+                doc = fitz.open(file_path, filetype="pdf")
+                if doc.is_encrypted and not doc.authenticate(""):
+                    doc.close()
                     return False, None, "PDF is encrypted"
-            except Exception:
-                return False, None, "PDF is encrypted"
-
-        page_count = len(reader.pages)
-        logger.debug(f"Probed PDF with pypdf: {safe_path}, pages={page_count}")
-        return True, page_count, ""
-
-    except FileNotDecryptedError:
-        return False, None, "PDF is encrypted"
-    except PdfReadError as e:
-        logger.warning(f"PDF read error for {safe_path}: {e}")
-        return False, None, "PDF is corrupt or unreadable"
-    except Exception as e:
-        logger.warning(f"Unexpected error probing {safe_path}: {e}")
-        return False, None, f"Error reading PDF: {type(e).__name__}"
+                page_count = doc.page_count
+                doc.close()
+                logger.debug(f"Probed PDF with PyMuPDF: {safe_path}, pages={page_count}")
+                return True, page_count, ""
+            except Exception as e:
+                # Fall through to pypdf
+                logger.debug(f"PyMuPDF failed, falling back to pypdf: {e}")
+
+        # Fall back to pypdf, which reads objects from the handle as needed
+        try:
+            f.seek(0)
+            reader = PdfReader(f)
+
+            # Check encryption
+            if check_encryption and reader.is_encrypted:
+                # Try empty password
+                try:
+                    if not reader.decrypt(""):
+                        return False, None, "PDF is encrypted"
+                except Exception:
+                    return False, None, "PDF is encrypted"
+
+            page_count = len(reader.pages)
+            logger.debug(f"Probed PDF with pypdf: {safe_path}, pages={page_count}")
+            return True, page_count, ""
+
+        except FileNotDecryptedError:
+            return False, None, "PDF is encrypted"
+        except PdfReadError as e:
+            logger.warning(f"PDF read error for {safe_path}: {e}")
+            return False, None, "PDF is corrupt or unreadable"
+        except Exception as e:
+            logger.warning(f"Unexpected error probing {safe_path}: {e}")
+            return False, None, f"Error reading PDF: {type(e).__name__}"
 
 
 def validate_and_update_queued_pdf(
@@ -129,21 +393,17 @@ def validate_and_update_queued_pdf(
     """
     safe_path = sanitize_path_for_log(queued_pdf.file_path)
 
-    # Check file exists
-    if not queued_pdf.file_path.exists():
+    # Check file exists, refreshing the cached size from the same stat so
+    # later manifest/report code never has to touch the filesystem
+    try:
+        queued_pdf.size_bytes = os.stat(queued_pdf.file_path).st_size
+    except OSError as e:
         queued_pdf.status = FileStatus.ERROR
-        queued_pdf.status_message = "File not found"
-        logger.info(f"File not found: {safe_path}")
-        return queued_pdf
-
-    # Check if it's a PDF
-    if not is_pdf_file(queued_pdf.file_path):
-        queued_pdf.status = FileStatus.NOT_PDF
-        queued_pdf.status_message = "Not a valid PDF"
-        logger.info(f"Not a PDF: {safe_path}")
+        queued_pdf.status_message = _os_error_message(e)
+        logger.info(f"File not accessible: {safe_path}: {queued_pdf.status_message}")
         return queued_pdf
 
-    # Probe the PDF
+    # Probe the PDF (this also does the magic-byte check)
     is_valid, page_count, error_message = probe_pdf(
         queued_pdf.file_path,
         check_encryption=True
@@ -154,6 +414,10 @@ def validate_and_update_queued_pdf(
         queued_pdf.page_count = page_count
         queued_pdf.status_message = ""
         logger.info(f"PDF validated: {safe_path}, pages={page_count}")
+    elif error_message == "Not a PDF file":
+        queued_pdf.status = FileStatus.NOT_PDF
+        queued_pdf.status_message = "Not a valid PDF"
+        logger.info(f"Not a PDF: {safe_path}")
     elif "encrypted" in error_message.lower():
         queued_pdf.status = FileStatus.ENCRYPTED
         queued_pdf.status_message = "Password protected"
@@ -173,6 +437,44 @@ def validate_and_update_queued_pdf(
     return queued_pdf
 
 
+def iter_validate_queue(
+    pdfs: List[QueuedPDF],
+    skip_encrypted: bool = True,
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[int, QueuedPDF]]:
+    """
+    Validate queued PDFs on a thread pool, yielding results in queue order.
+
+    Probing is dominated by file I/O and pypdf parsing, so several files
+    are validated concurrently. Closing the iterator early cancels any
+    validations that haven't started.
+
+    Args:
+        pdfs: QueuedPDFs to validate
+        skip_encrypted: Whether to mark encrypted PDFs as skipped
+        max_workers: Worker count (default: up to 8)
+
+    Yields:
+        (index, QueuedPDF) for each file, in queue order
+    """
+    if not pdfs:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or min(8, len(pdfs)),
+        thread_name_prefix="pdf-validate"
+    )
+    try:
+        futures = [
+            executor.submit(validate_and_update_queued_pdf, pdf, skip_encrypted)
+            for pdf in pdfs
+        ]
+        for i, future in enumerate(futures):
+            yield i, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def try_decrypt_pdf(file_path: Path, password: str) -> Tuple[bool, Optional[int]]:
     """
     Try to decrypt a PDF with a password.
@@ -187,7 +489,8 @@ def try_decrypt_pdf(file_path: Path, password: str) -> Tuple[bool, Optional[int]
     safe_path = sanitize_path_for_log(file_path)
 
     # Try PyMuPDF first
-    if HAS_PYMUPDF:
+    fitz = _get_fitz()
+    if fitz is not None:
         try:
             doc = fitz.open(file_path)
             if doc.authenticate(password):
@@ -5,6 +5,7 @@ Ensures sensitive information is not logged while maintaining useful debugging i
 """
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -30,6 +31,14 @@ class SanitizedFormatter(logging.Formatter):
         re.IGNORECASE
     )
 
+    # Both of the above fused into one pass that matches just the username
+    # segment, so every path in the text is redacted, not only the first
+    USERNAME_PATTERN = re.compile(
+        r'(?P<users>[A-Za-z]:\\Users\\)[^\\\n]+(?=\\)'
+        r'|(?P<home>/home/)[^/\n]+(?=/)',
+        re.IGNORECASE
+    )
+
     def __init__(
         self,
         fmt: Optional[str] = None,
@@ -59,19 +68,18 @@ class SanitizedFormatter(logging.Formatter):
     def _sanitize_message(self, message: str) -> str:
         """Sanitize a log message."""
         if self.redact_usernames:
-            # Redact Windows user paths
-            message = self.USER_PATH_PATTERN.sub(
-                r'\1<user>\3',
-                message
-            )
-            # Redact Unix home paths
-            message = self.HOME_PATH_PATTERN.sub(
-                r'\1<user>\3',
-                message
-            )
+            message = self.redact_user_paths(message)
 
         return message
 
+    @classmethod
+    def redact_user_paths(cls, text: str) -> str:
+        """Replace usernames in Windows and Unix home paths with <user>."""
+        # Cheap substring checks skip the regex for the common no-path case
+        if ':\\' not in text and '/h' not in text and '/H' not in text:
+            return text
+        return cls.USERNAME_PATTERN.sub(r'\g<users>\g<home><user>', text)
+
 
 def setup_logging(
     log_level: int = logging.INFO,
@@ -118,31 +126,26 @@ def setup_logging(
     return logger
 
 
+@lru_cache(maxsize=4096)
+def _sanitize_str(path_str: str) -> str:
+    """Redact a path string; memoized since queue paths are logged repeatedly."""
+    return SanitizedFormatter.redact_user_paths(path_str)
+
+
 def sanitize_path_for_log(path: Path) -> str:
     """
     Sanitize a path for logging.
 
     Args:
-        path: Path to sanitize
+        path: Path (or path string) to sanitize
 
     Returns:
         Sanitized path string
     """
-    path_str = str(path)
-
-    # Redact Windows user paths
-    path_str = SanitizedFormatter.USER_PATH_PATTERN.sub(
-        r'\1<user>\3',
-        path_str
-    )
+    return _sanitize_str(str(path))
 
-    # Redact Unix home paths
-    path_str = SanitizedFormatter.HOME_PATH_PATTERN.sub(
-        r'\1<user>\3',
-        path_str
-    )
 
-    return path_str
+sanitize_path_for_log.cache_clear = _sanitize_str.cache_clear
 
 
 def safe_log_dict(data: Dict[str, Any], exclude_keys: Optional[set] = None) -> Dict[str, Any]:
@@ -177,13 +180,11 @@ def safe_log_dict(data: Dict[str, Any], exclude_keys: Optional[set] = None) -> D
     return result
 
 
-# Global logger instance
-_logger: Optional[logging.Logger] = None
-
-
 def get_logger() -> logging.Logger:
-    """Get the application logger, initializing if needed."""
-    global _logger
-    if _logger is None:
-        _logger = setup_logging()
-    return _logger
+    """
+    Get the application logger.
+
+    Handlers are not installed here; the application entry point calls
+    setup_logging() once, so importing a module never configures logging.
+    """
+    return logging.getLogger("pdf_consolidator")
@@ -10,16 +10,39 @@ settings/logs are stored in <app_folder>/data/ instead of %APPDATA%.
 import json
 import os
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, ClassVar
 
 from .sanitize import get_logger
+from .utils import normalize_path
+
+# Check for orjson availability (faster settings load/save)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 # Application name for settings directory
 APP_NAME = "PDFConsolidator"
 
+
+def _dumps_settings(data: Dict[str, Any]) -> bytes:
+    """Serialize settings to indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads_settings(raw: bytes) -> Any:
+    """Parse settings JSON (orjson errors subclass json.JSONDecodeError)."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # Cache for portable mode detection
 _portable_mode_cache: Optional[bool] = None
 _app_base_dir_cache: Optional[Path] = None
@@ -170,6 +193,10 @@ class AppSettings:
     # First run tracking
     first_run_shown: bool = False
 
+    # Field names for from_dict, filled in on the first load rather than
+    # recomputed on every one (a ClassVar, so not a field itself)
+    _FIELD_NAMES: ClassVar[frozenset] = frozenset()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return asdict(self)
@@ -177,10 +204,11 @@ class AppSettings:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AppSettings':
         """Create settings from dictionary."""
+        names = cls._FIELD_NAMES
+        if not names:
+            names = cls._FIELD_NAMES = frozenset(f.name for f in fields(cls))
         # Filter to only known fields
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        return cls(**{k: data[k] for k in data.keys() & names})
 
     def add_recent_directory(self, directory: str) -> None:
         """Add a directory to recent list."""
@@ -213,9 +241,11 @@ class AppSettings:
         if not self.allowed_output_directories:
             return True  # No restrictions if list is empty
 
+        # The output name changes with every merge, so only the allowed
+        # directories go through the normalize_path cache
         output_resolved = output_path.resolve()
         for allowed in self.allowed_output_directories:
-            allowed_path = Path(allowed).resolve()
+            allowed_path = normalize_path(Path(allowed))
             try:
                 output_resolved.relative_to(allowed_path)
                 return True
@@ -256,8 +286,8 @@ class SettingsManager:
             return AppSettings()
 
         try:
-            with open(self._settings_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self._settings_path, 'rb') as f:
+                data = _loads_settings(f.read())
             self._logger.info("Settings loaded from file")
             return AppSettings.from_dict(data)
         except (json.JSONDecodeError, IOError) as e:
@@ -284,8 +314,8 @@ class SettingsManager:
             # Ensure directory exists
             self._settings_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self._settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings.to_dict(), f, indent=2)
+            with open(self._settings_path, 'wb') as f:
+                f.write(_dumps_settings(self._settings.to_dict()))
 
             self._logger.info("Settings saved")
             return True
@@ -4,13 +4,15 @@ Support bundle creation for PDF Consolidator.
 Creates a ZIP file containing logs, settings, and recent reports for support purposes.
 Never includes PDF files or sensitive data.
 """
+import heapq
 import io
 import os
 import re
+import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import BinaryIO, Callable, Iterator, List, Tuple, Optional
 
 from .settings import get_app_data_dir, get_settings_path, get_log_path, get_reports_dir
 from .sanitize import get_logger, sanitize_path_for_log, SanitizedFormatter
@@ -31,6 +33,31 @@ MAX_RECENT_REPORTS = 10
 # PDF magic bytes
 PDF_MAGIC = b'%PDF-'
 
+# Deflate level for bundle entries. Bundles are short-lived and mostly
+# text, so speed matters more than the few percent level 6 would save
+BUNDLE_COMPRESSLEVEL = 1
+
+# Entries smaller than this are stored rather than deflated; the deflate
+# overhead outweighs anything it saves on a few hundred bytes
+STORE_THRESHOLD = 512
+
+# Read size when streaming a file into the bundle
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Read size when copying a file into the bundle without sanitizing it
+RAW_COPY_CHUNK_SIZE = 1 << 20
+
+# Files up to this size are staged in memory; larger ones go through a
+# temporary file that ZipFile.write() streams into the bundle
+SPOOL_MAX_MEMORY = 1 << 20
+
+# Bytes-mode copy of SanitizedFormatter.USERNAME_PATTERN, compiled once
+_USERNAME_PATTERN_BYTES = re.compile(
+    SanitizedFormatter.USERNAME_PATTERN.pattern.encode('utf-8'),
+    SanitizedFormatter.USERNAME_PATTERN.flags & ~re.UNICODE
+)
+_USERNAME_REPLACEMENT_BYTES = rb'\g<users>\g<home><user>'
+
 
 class BundleVerificationError(Exception):
     """Raised when bundle verification fails."""
@@ -47,55 +74,234 @@ def sanitize_file_content(content: str) -> str:
     Returns:
         Sanitized content
     """
-    # Redact Windows user paths
-    content = SanitizedFormatter.USER_PATH_PATTERN.sub(
-        r'\1<user>\3',
-        content
-    )
-    # Redact Unix home paths
-    content = SanitizedFormatter.HOME_PATH_PATTERN.sub(
-        r'\1<user>\3',
-        content
-    )
-    return content
+    return SanitizedFormatter.redact_user_paths(content)
+
+
+def sanitize_file_content_bytes(content: bytes) -> bytes:
+    """
+    Sanitize raw file content by redacting usernames from paths.
+
+    Byte-level equivalent of sanitize_file_content(), so streamed chunks
+    never need a decode/encode round trip.
+
+    Args:
+        content: Original content, containing only whole lines
+
+    Returns:
+        Sanitized content
+    """
+    return _USERNAME_PATTERN_BYTES.sub(_USERNAME_REPLACEMENT_BYTES, content)
+
+
+def _maybe_sanitize(buf: bytes) -> bytes:
+    """
+    sanitize_file_content_bytes(), run only if buf could contain a match.
+
+    Every match starts with ':\\Users\\' or '/home/' (in any case), so a few
+    substring scans, which run at memchr speed, rule out most chunks
+    without starting the regex engine. The anchors are deliberately loose
+    enough to stay case-insensitive.
+    """
+    if (
+        b':\\U' not in buf and b':\\u' not in buf
+        and b'/h' not in buf and b'/H' not in buf
+    ):
+        return buf
+    return sanitize_file_content_bytes(buf)
+
+
+def _compress_type_for(zf: zipfile.ZipFile, size: int) -> int:
+    """
+    Compression for a bundle entry of the given size.
+
+    Small entries are stored rather than deflated; larger ones get the
+    archive's compression, and with it the archive's compresslevel.
+    """
+    return zipfile.ZIP_STORED if size < STORE_THRESHOLD else zf.compression
+
+
+def _iter_line_chunks(
+    f: BinaryIO,
+    transform: Optional[Callable[[bytes], bytes]] = None
+) -> Iterator[bytes]:
+    """
+    Read a binary file in STREAM_CHUNK_SIZE pieces that end on line breaks.
+
+    The partial last line of each read is carried into the next one, so a
+    path is never split across chunks before transform() sees it.
+    """
+    carry = b''
+    while True:
+        block = f.read(STREAM_CHUNK_SIZE)
+        if not block:
+            break
+        block = carry + block
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            carry = block
+            continue
+        carry = block[cut:]
+        yield transform(block[:cut]) if transform else block[:cut]
+    if carry:
+        yield transform(carry) if transform else carry
+
+
+def _stage_sanitized(file_path: Path, staged: BinaryIO) -> Tuple[int, str]:
+    """
+    Copy a file into staged line chunk by line chunk, sanitizing as it goes.
+
+    Chunks end on line breaks, so a path is never split before the regex
+    sees it and the magic can never straddle two chunks. Sanitizing can
+    lengthen a line, hence the running size total.
+
+    Returns:
+        Tuple of (bytes_staged, reason_skipped)
+    """
+    total = 0
+    with open(file_path, 'rb', buffering=STREAM_CHUNK_SIZE) as src:
+        for chunk in _iter_line_chunks(src, _maybe_sanitize):
+            total += len(chunk)
+            if total > MAX_FILE_SIZE:
+                return total, f"File too large: over {MAX_FILE_SIZE} bytes"
+            is_safe, error = verify_content_safe(chunk)
+            if not is_safe:
+                return total, error
+            staged.write(chunk)
+    return total, ""
+
+
+def _stage_raw(file_path: Path, staged: BinaryIO) -> Tuple[int, str]:
+    """
+    Unsanitized counterpart of _stage_sanitized: a straight copy.
+
+    Reads RAW_COPY_CHUNK_SIZE at a time into one reused buffer, with no
+    line splitting and no per-chunk bytes objects. Reads aren't line
+    aligned, so the magic check also covers the seams between them.
+
+    Returns:
+        Tuple of (bytes_staged, reason_skipped)
+    """
+    buf = bytearray(RAW_COPY_CHUNK_SIZE)
+    view = memoryview(buf)
+    seam = len(PDF_MAGIC) - 1
+    total = 0
+    tail = b''
+
+    with open(file_path, 'rb', buffering=0) as src:
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                return total, ""
+            total += n
+            if total > MAX_FILE_SIZE:
+                return total, f"File too large: over {MAX_FILE_SIZE} bytes"
+            across_seam = tail + view[:min(n, seam)].tobytes()
+            if buf.find(PDF_MAGIC, 0, n) >= 0 or PDF_MAGIC in across_seam:
+                return total, "File contains PDF content"
+            staged.write(view[:n])
+            tail = bytes(view[max(0, n - seam):n])
+
+
+def _stream_file_to_bundle(
+    zf: zipfile.ZipFile,
+    file_path: Path,
+    archive_name: str,
+    ext: str,
+    sanitize_content: bool
+) -> Tuple[bool, str]:
+    """
+    Copy one file into the bundle chunk by chunk, sanitizing as it goes.
+
+    Extension and size are checked from a stat before the file is opened,
+    so rejected files are never read. The content is then staged, in
+    memory or in a temporary file past SPOOL_MAX_MEMORY, and only goes
+    into the archive once every chunk passed the size and PDF checks. A
+    file that grew past MAX_FILE_SIZE, turned out to hold PDF content, or
+    failed to read is skipped without leaving a partial entry behind.
+    Both writestr() and write() stamp the entry with the current time.
+
+    Returns:
+        Tuple of (added, reason_skipped)
+
+    Raises:
+        OSError: If the file couldn't be read; nothing was added
+    """
+    size = os.stat(file_path).st_size
+    is_safe, error = verify_metadata_safe(ext, size)
+    if not is_safe:
+        return False, error
+
+    stage = _stage_sanitized if sanitize_content else _stage_raw
+    if size <= SPOOL_MAX_MEMORY:
+        staged = io.BytesIO()
+        total, error = stage(file_path, staged)
+        if error:
+            return False, error
+        zf.writestr(
+            archive_name, staged.getvalue(),
+            compress_type=_compress_type_for(zf, total)
+        )
+        return True, ""
+
+    fd, staged_path = tempfile.mkstemp(prefix="bundle-")
+    try:
+        with open(fd, 'wb') as staged:
+            total, error = stage(file_path, staged)
+        if error:
+            return False, error
+        zf.write(staged_path, archive_name, compress_type=_compress_type_for(zf, total))
+    finally:
+        os.unlink(staged_path)
+    return True, ""
+
+
+def _list_files(directory: Path, suffix: str) -> List[os.DirEntry]:
+    """List regular files in directory whose names end with suffix."""
+    try:
+        with os.scandir(directory) as it:
+            return [
+                e for e in it
+                if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
 
 
-def get_files_for_bundle() -> List[Tuple[Path, str]]:
+def get_files_for_bundle() -> List[Tuple[Path, str, str]]:
     """
     Get list of files to include in support bundle.
 
     Returns:
-        List of (file_path, archive_name) tuples
+        List of (file_path, archive_name, extension) tuples; the extension
+        is lowercased, ready for verify_metadata_safe()
     """
-    files: List[Tuple[Path, str]] = []
+    files: List[Tuple[Path, str, str]] = []
     app_dir = get_app_data_dir()
 
     # Settings file
     settings_path = get_settings_path()
     if settings_path.exists():
-        files.append((settings_path, "settings.json"))
+        files.append((settings_path, "settings.json", ".json"))
 
     # Main log file
     log_path = get_log_path()
     if log_path.exists():
-        files.append((log_path, "app.log"))
+        files.append((log_path, "app.log", ".log"))
 
     # Additional log files in app directory
-    for log_file in app_dir.glob("*.log"):
+    for entry in _list_files(app_dir, '.log'):
+        log_file = Path(entry.path)
         if log_file != log_path:  # Don't duplicate main log
-            files.append((log_file, f"logs/{log_file.name}"))
+            files.append((log_file, f"logs/{entry.name}", ".log"))
 
-    # Recent reports
-    reports_dir = get_reports_dir()
-    if reports_dir.exists():
-        report_files = sorted(
-            reports_dir.glob("*.txt"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )[:MAX_RECENT_REPORTS]
-
-        for report in report_files:
-            files.append((report, f"reports/{report.name}"))
+    # Recent reports (scandir entries cache their stat for the sort key)
+    report_entries = heapq.nlargest(
+        MAX_RECENT_REPORTS,
+        _list_files(get_reports_dir(), '.txt'),
+        key=lambda e: e.stat().st_mtime
+    )
+    for entry in report_entries:
+        files.append((Path(entry.path), f"reports/{entry.name}", ".txt"))
 
     # Also check for .txt files next to output PDFs (merge reports)
     # These are in the output directories, so we look in recent reports folder
@@ -103,84 +309,144 @@ def get_files_for_bundle() -> List[Tuple[Path, str]]:
     return files
 
 
-def verify_file_safe(file_path: Path, file_content: bytes) -> Tuple[bool, str]:
+def verify_metadata_safe(ext: str, size: int) -> Tuple[bool, str]:
     """
-    Verify a file is safe to include in the bundle.
+    Check what can be known about a file without reading it.
 
     Checks:
     - File extension is allowed
     - File size is within limit
-    - No PDF magic bytes present
 
     Args:
-        file_path: Path to the file
-        file_content: Content of the file
+        ext: Lowercased file extension, including the dot
+        size: Size of the file (or its content) in bytes
 
     Returns:
         Tuple of (is_safe, error_message)
     """
     # Check extension
-    if file_path.suffix.lower() not in ALLOWED_EXTENSIONS:
-        return False, f"Disallowed extension: {file_path.suffix}"
+    if ext not in ALLOWED_EXTENSIONS:
+        return False, f"Disallowed extension: {ext}"
 
     # Check size
-    if len(file_content) > MAX_FILE_SIZE:
-        return False, f"File too large: {len(file_content)} bytes (max {MAX_FILE_SIZE})"
+    if size > MAX_FILE_SIZE:
+        return False, f"File too large: {size} bytes (max {MAX_FILE_SIZE})"
 
-    # Check for PDF magic bytes
-    if PDF_MAGIC in file_content:
-        return False, "File contains PDF content"
+    return True, ""
+
+
+def verify_content_safe(content: bytes) -> Tuple[bool, str]:
+    """
+    Check file content, or one line-aligned chunk of it, for PDF data.
 
+    Args:
+        content: Content to check
+
+    Returns:
+        Tuple of (is_safe, error_message)
+    """
+    if PDF_MAGIC in content:
+        return False, "File contains PDF content"
     return True, ""
 
 
-def verify_bundle_no_secrets(zip_path: Path) -> Tuple[bool, List[str]]:
+def verify_file_safe(file_path: Path, file_content: bytes) -> Tuple[bool, str]:
     """
-    Verify a support bundle doesn't contain secrets or PDFs.
+    Verify a file is safe to include in the bundle.
+
+    Combines verify_metadata_safe() and verify_content_safe() for callers
+    that already hold the whole content.
 
     Args:
-        zip_path: Path to the ZIP file
+        file_path: Path to the file
+        file_content: Content of the file
 
     Returns:
-        Tuple of (is_valid, list_of_issues)
+        Tuple of (is_safe, error_message)
+    """
+    is_safe, error = verify_metadata_safe(
+        os.path.splitext(file_path.name)[1].lower(), len(file_content)
+    )
+    if not is_safe:
+        return is_safe, error
+    return verify_content_safe(file_content)
+
+
+def _verify_open_bundle(
+    zf: zipfile.ZipFile,
+    check_content: bool = True
+) -> List[str]:
+    """
+    Check the entries of an already-open bundle.
+
+    Args:
+        zf: Bundle opened for reading
+        check_content: Also decompress and scan entries for PDF magic bytes
+
+    Returns:
+        List of issues found (empty if the bundle is clean)
     """
     issues: List[str] = []
 
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            for info in zf.infolist():
-                name = info.filename
+    for info in zf.infolist():
+        name = info.filename
 
-                # Check extension
-                ext = Path(name).suffix.lower()
-                if ext and ext not in ALLOWED_EXTENSIONS:
-                    issues.append(f"Disallowed file type: {name}")
-                    continue
+        # Check extension
+        ext = os.path.splitext(name)[1].lower()
+        if ext and ext not in ALLOWED_EXTENSIONS:
+            issues.append(f"Disallowed file type: {name}")
+            continue
 
-                # Check size
-                if info.file_size > MAX_FILE_SIZE:
-                    issues.append(f"File too large: {name} ({info.file_size} bytes)")
-                    continue
+        # Check size
+        if info.file_size > MAX_FILE_SIZE:
+            issues.append(f"File too large: {name} ({info.file_size} bytes)")
+            continue
+
+        if not check_content:
+            continue
+
+        # Check content for PDF magic bytes
+        try:
+            content = zf.read(info)
+            if PDF_MAGIC in content:
+                issues.append(f"PDF content detected in: {name}")
+        except Exception as e:
+            issues.append(f"Could not read {name}: {e}")
 
-                # Check content for PDF magic bytes
-                try:
-                    content = zf.read(info.filename)
-                    if PDF_MAGIC in content:
-                        issues.append(f"PDF content detected in: {name}")
-                except Exception as e:
-                    issues.append(f"Could not read {name}: {e}")
+    return issues
 
+
+def verify_bundle_no_secrets(
+    zip_path: Path,
+    check_content: bool = True
+) -> Tuple[bool, List[str]]:
+    """
+    Verify a support bundle doesn't contain secrets or PDFs.
+
+    Args:
+        zip_path: Path to the ZIP file
+        check_content: Decompress every entry and scan it for PDF magic
+            bytes. Pass False when the content was already checked while
+            writing; only names and sizes are verified then.
+
+    Returns:
+        Tuple of (is_valid, list_of_issues)
+    """
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            issues = _verify_open_bundle(zf, check_content)
     except zipfile.BadZipFile:
-        issues.append("Invalid ZIP file")
+        issues = ["Invalid ZIP file"]
     except Exception as e:
-        issues.append(f"Verification error: {e}")
+        issues = [f"Verification error: {e}"]
 
     return len(issues) == 0, issues
 
 
 def create_support_bundle(
     dest_zip_path: Path,
-    sanitize_content: bool = True
+    sanitize_content: bool = True,
+    compresslevel: int = BUNDLE_COMPRESSLEVEL
 ) -> Path:
     """
     Create a support bundle ZIP file.
@@ -198,6 +464,7 @@ def create_support_bundle(
     Args:
         dest_zip_path: Where to save the ZIP file
         sanitize_content: Whether to sanitize paths in file content
+        compresslevel: Deflate level, 0-9
 
     Returns:
         Path to the created ZIP file
@@ -217,7 +484,9 @@ def create_support_bundle(
         logger.warning("No files found for support bundle")
 
     # Create ZIP file
-    with zipfile.ZipFile(dest_zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(
+        dest_zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    ) as zf:
         # Add metadata file
         metadata = f"""PDF Consolidator Support Bundle
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -227,43 +496,29 @@ This bundle contains diagnostic information for troubleshooting.
 No PDF files or sensitive data are included.
 Paths have been sanitized to remove usernames.
 """
-        zf.writestr("README.txt", metadata)
+        zf.writestr(
+            "README.txt", metadata,
+            compress_type=_compress_type_for(zf, len(metadata))
+        )
 
-        # Add each file
-        for file_path, archive_name in files:
+        # Add each file, streamed so no file is ever held in memory whole
+        for file_path, archive_name, ext in files:
             try:
-                # Read content
-                if file_path.suffix.lower() == '.json':
-                    # JSON files - read as text
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    if sanitize_content:
-                        content = sanitize_file_content(content)
-                    content_bytes = content.encode('utf-8')
-                else:
-                    # Log/text files - read as text and sanitize
-                    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        content = f.read()
-                    if sanitize_content:
-                        content = sanitize_file_content(content)
-                    content_bytes = content.encode('utf-8')
-
-                # Verify file is safe
-                is_safe, error = verify_file_safe(file_path, content_bytes)
-                if not is_safe:
+                added, error = _stream_file_to_bundle(
+                    zf, file_path, archive_name, ext, sanitize_content
+                )
+                if not added:
                     logger.warning(f"Skipping unsafe file {file_path}: {error}")
                     continue
-
-                # Add to ZIP
-                zf.writestr(archive_name, content_bytes)
                 logger.debug(f"Added to bundle: {archive_name}")
 
             except Exception as e:
                 logger.warning(f"Failed to add {file_path} to bundle: {e}")
 
-    # Verify the bundle
-    is_valid, issues = verify_bundle_no_secrets(dest_zip_path)
-    if not is_valid:
+    # Verify the bundle. Content was already scanned for PDF magic while it
+    # was written, so only the entry names and sizes are re-checked here
+    _, issues = verify_bundle_no_secrets(dest_zip_path, check_content=False)
+    if issues:
         # Delete the bundle if verification fails
         try:
             dest_zip_path.unlink()
@@ -297,18 +552,20 @@ def get_bundle_info(zip_path: Path) -> dict:
         'issues': []
     }
 
-    if not zip_path.exists():
+    if not info['exists']:
         return info
 
     try:
         info['size_bytes'] = zip_path.stat().st_size
 
+        # One handle serves both the listing and the verification pass
         with zipfile.ZipFile(zip_path, 'r') as zf:
-            info['file_count'] = len(zf.namelist())
-            info['files'] = zf.namelist()
+            names = zf.namelist()
+            info['file_count'] = len(names)
+            info['files'] = names
+            issues = _verify_open_bundle(zf)
 
-        is_valid, issues = verify_bundle_no_secrets(zip_path)
-        info['is_valid'] = is_valid
+        info['is_valid'] = not issues
         info['issues'] = issues
 
     except Exception as e:
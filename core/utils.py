@@ -3,11 +3,44 @@ Utility functions for PDF Consolidator.
 """
 import hashlib
 import os
-import re
+import string
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import FrozenSet, Iterator, Optional, List, Tuple
+
+
+# Characters not allowed in Windows filenames, mapped to '_'
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# strftime formats for the output filename template placeholders
+_TEMPLATE_FORMATS = {
+    'timestamp': "%Y%m%d_%H%M",
+    'date': "%Y%m%d",
+    'time': "%H%M",
+}
+
+# Flags for raw header reads (O_BINARY/O_SEQUENTIAL only exist on Windows)
+RAW_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+
+# hashlib.file_digest was added in Python 3.11
+HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
+# Check for blake3 availability (faster content hashing for duplicate checks)
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+
+@lru_cache(maxsize=64)
+def _template_fields(template: str) -> FrozenSet[str]:
+    """Names of the placeholders used in a filename template."""
+    return frozenset(
+        name for _, name, _, _ in string.Formatter().parse(template) if name
+    )
 
 
 def generate_output_filename(
@@ -29,16 +62,18 @@ def generate_output_filename(
     Returns:
         Full path to output file
     """
+    # One clock reading for every placeholder, formatting only those used
     now = datetime.now()
-    timestamp = now.strftime("%Y%m%d_%H%M")
-    date = now.strftime("%Y%m%d")
-    time = now.strftime("%H%M")
-
-    filename = template.format(
-        timestamp=timestamp,
-        date=date,
-        time=time
-    )
+    if '{timestamp}' in template and template.count('{') == 1 and template.count('}') == 1:
+        # The default template's only placeholder; a plain replace is enough
+        timestamp = now.strftime(_TEMPLATE_FORMATS['timestamp'])
+        filename = template.replace('{timestamp}', timestamp)
+    else:
+        filename = template.format(**{
+            name: now.strftime(_TEMPLATE_FORMATS[name])
+            for name in _template_fields(template)
+            if name in _TEMPLATE_FORMATS
+        })
 
     # Ensure .pdf extension
     if not filename.lower().endswith('.pdf'):
@@ -63,9 +98,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for Windows/Unix
     """
-    # Remove or replace invalid characters
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    # Replace invalid characters
+    sanitized = filename.translate(_INVALID_FILENAME_CHARS)
 
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(' .')
@@ -77,22 +111,99 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
-def compute_sha256(file_path: Path, chunk_size: int = 8192) -> str:
+def compute_hash(
+    file_path: Path,
+    algo: str = "blake2b",
+    chunk_size: int = 1 << 20
+) -> str:
+    """
+    Compute a content hash of a file.
+
+    Uses hashlib.file_digest (Python 3.11+), which streams the file through
+    a GIL-free C loop. Older interpreters fall back to readinto() over a
+    single reused buffer. BLAKE2b is the default because it is faster than
+    SHA256 and plenty for fingerprinting; pass algo="sha256" where the
+    digest is shown to users.
+
+    Args:
+        file_path: Path to file
+        algo: hashlib algorithm name
+        chunk_size: Buffer size in bytes for the fallback path
+
+    Returns:
+        Hex digest of the file content
+    """
+    with open(file_path, 'rb') as f:
+        if HAS_FILE_DIGEST:
+            return hashlib.file_digest(f, algo).hexdigest()
+        h = hashlib.new(algo)
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+def compute_sha256(file_path: Path, chunk_size: int = 1 << 20) -> str:
     """
     Compute SHA256 hash of a file.
 
+    This is the digest written to merge manifests; see compute_hash.
+
     Args:
         file_path: Path to file
-        chunk_size: Read chunk size in bytes
+        chunk_size: Buffer size in bytes for the fallback path
 
     Returns:
         Hex digest of SHA256 hash
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(chunk_size):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    return compute_hash(file_path, "sha256", chunk_size)
+
+
+def compute_content_hash(file_path: Path) -> str:
+    """
+    Compute the hash used to spot the same content under different names.
+
+    Uses BLAKE3 over a memory map of the file when the blake3 package is
+    installed, otherwise BLAKE2b via compute_hash. Only compare digests
+    produced by this function with each other.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Hex digest of the file content
+    """
+    if HAS_BLAKE3:
+        return blake3.blake3().update_mmap(file_path).hexdigest()
+    return compute_hash(file_path)
+
+
+def _scandir_recursive(path: str, max_depth: int) -> Iterator[os.DirEntry]:
+    """
+    Yield the non-directory entries under path.
+
+    Descends at most max_depth levels below path, never follows directory
+    symlinks, and skips directories that can't be read. Walks with an
+    explicit stack, so entries deep in the tree aren't passed up through
+    a chain of nested generators.
+    """
+    stack = [(path, max_depth)]
+    while stack:
+        dir_path, depth = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if not is_dir:
+                        yield entry
+                    elif depth > 0:
+                        stack.append((entry.path, depth - 1))
+        except OSError:
+            pass  # Skip directories we can't access (or that aren't one)
 
 
 def find_pdfs_in_directory(
@@ -109,36 +220,51 @@ def find_pdfs_in_directory(
         max_depth: Maximum recursion depth
 
     Returns:
-        List of paths to PDF files
+        List of paths to PDF files (empty if directory isn't a readable
+        directory)
     """
     pdf_files: List[Path] = []
 
-    if not directory.is_dir():
-        return pdf_files
-
-    pattern = "**/*.pdf" if include_subfolders else "*.pdf"
-
-    try:
-        for path in directory.glob(pattern):
-            if path.is_file():
-                pdf_files.append(path)
-    except PermissionError:
-        pass  # Skip directories we can't access
+    depth = max_depth if include_subfolders else 0
+    for entry in _scandir_recursive(os.fspath(directory), depth):
+        # is_file() comes from the directory listing itself for regular
+        # files; only symlinks (followed, so linked PDFs count) cost a stat
+        if entry.name[-4:].lower() == '.pdf' and entry.is_file():
+            pdf_files.append(Path(entry.path))
 
-    return sorted(pdf_files)
+    pdf_files.sort()
+    return pdf_files
 
 
 def normalize_path(path: Path) -> Path:
     """
     Normalize a path for consistent comparison.
 
+    Results for absolute paths are memoized, since duplicate checks resolve
+    every queued path again. A directory renamed while the app runs keeps
+    its old resolution until normalize_path.cache_clear() is called.
+    Relative paths depend on the current directory, so they are resolved
+    afresh each time.
+
     Args:
         path: Path to normalize
 
     Returns:
         Normalized absolute path
     """
-    return path.resolve()
+    path_str = os.fspath(path)
+    if not os.path.isabs(path_str):
+        return Path(path_str).resolve()
+    return _resolve_cached(path_str)
+
+
+@lru_cache(maxsize=2048)
+def _resolve_cached(path_str: str) -> Path:
+    """Resolve a path string (memoized for normalize_path)."""
+    return Path(path_str).resolve()
+
+
+normalize_path.cache_clear = _resolve_cached.cache_clear
 
 
 def find_unique_path(base_path: Path) -> Path:
@@ -160,14 +286,29 @@ def find_unique_path(base_path: Path) -> Path:
     suffix = base_path.suffix
     parent = base_path.parent
 
-    counter = 1
-    while True:
-        new_path = parent / f"{stem}_{counter:02d}{suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
-        if counter > 1000:  # Safety limit
-            raise ValueError("Could not find unique filename")
+    # One directory listing rules out taken names without a stat each;
+    # normcase keeps the comparison case-insensitive on Windows
+    prefix = os.path.normcase(f"{stem}_")
+    try:
+        with os.scandir(parent) as it:
+            taken = {
+                name for name in (os.path.normcase(e.name) for e in it)
+                if name.startswith(prefix)
+            }
+    except OSError:
+        # Can't list the folder (e.g. write-only share): probe each name
+        taken = None
+
+    for counter in range(1, 1001):  # Safety limit
+        name = f"{stem}_{counter:02d}{suffix}"
+        if taken is not None and os.path.normcase(name) in taken:
+            continue
+        # Confirm the pick: the listing may be stale, and normcase can't
+        # see case-insensitive volumes elsewhere (macOS, SMB shares)
+        candidate = parent / name
+        if not candidate.exists():
+            return candidate
+    raise ValueError("Could not find unique filename")
 
 
 def format_duration(seconds: float) -> str:
@@ -206,6 +347,40 @@ def truncate_path(path: Path, max_length: int = 60) -> str:
     return "...\\" + filename
 
 
+# GetDriveTypeW return values
+_DRIVE_TYPE_NAMES = {
+    0: "Unknown",           # DRIVE_UNKNOWN
+    1: "No Root Dir",       # DRIVE_NO_ROOT_DIR
+    2: "Removable",         # DRIVE_REMOVABLE
+    3: "Fixed",             # DRIVE_FIXED
+    4: "Remote/Network",    # DRIVE_REMOTE
+    5: "CD-ROM",            # DRIVE_CDROM
+    6: "RAM Disk",          # DRIVE_RAMDISK
+}
+
+
+@lru_cache(maxsize=None)
+def _get_drive_type_fn():
+    """Look up kernel32.GetDriveTypeW once and declare its signature."""
+    import ctypes
+
+    fn = ctypes.windll.kernel32.GetDriveTypeW
+    fn.argtypes = [ctypes.c_wchar_p]
+    fn.restype = ctypes.c_uint
+    return fn
+
+
+@lru_cache(maxsize=32)
+def _get_drive_type(root: str) -> int:
+    """
+    Get the drive type of a drive root such as 'E:\\'.
+
+    Cached for the session; a drive letter rarely changes type while the
+    app is running.
+    """
+    return _get_drive_type_fn()(root)
+
+
 def is_removable_drive(path: Path) -> Tuple[bool, str]:
     """
     Check if a path is on a removable drive (Windows only).
@@ -220,35 +395,11 @@ def is_removable_drive(path: Path) -> Tuple[bool, str]:
         return False, "Not Windows"
 
     try:
-        import ctypes
-        from ctypes import wintypes
-
-        # Get drive letter
-        drive = str(path.resolve()).split(':')[0] + ':'
-
-        # GetDriveTypeW returns:
-        # 0 = DRIVE_UNKNOWN
-        # 1 = DRIVE_NO_ROOT_DIR
-        # 2 = DRIVE_REMOVABLE
-        # 3 = DRIVE_FIXED
-        # 4 = DRIVE_REMOTE
-        # 5 = DRIVE_CDROM
-        # 6 = DRIVE_RAMDISK
-
-        kernel32 = ctypes.windll.kernel32
-        drive_type = kernel32.GetDriveTypeW(drive + '\\')
-
-        drive_types = {
-            0: "Unknown",
-            1: "No Root Dir",
-            2: "Removable",
-            3: "Fixed",
-            4: "Remote/Network",
-            5: "CD-ROM",
-            6: "RAM Disk"
-        }
-
-        type_name = drive_types.get(drive_type, "Unknown")
+        # Get drive letter (or UNC share)
+        drive = os.path.splitdrive(str(normalize_path(path)))[0]
+
+        drive_type = _get_drive_type(drive + '\\')
+        type_name = _DRIVE_TYPE_NAMES.get(drive_type, "Unknown")
 
         # Consider removable: USB drives, CD-ROMs
         is_removable = drive_type in (2, 5)
@@ -272,7 +423,7 @@ def is_path_within_directory(path: Path, directory: Path) -> bool:
         True if path is within directory
     """
     try:
-        path.resolve().relative_to(directory.resolve())
+        normalize_path(path).relative_to(normalize_path(directory))
         return True
     except ValueError:
         return False
@@ -332,21 +483,3 @@ def ensure_directory_exists(directory: Path) -> bool:
 def is_valid_pdf_extension(file_path: Path) -> bool:
     """Check if file has a PDF extension."""
     return file_path.suffix.lower() == '.pdf'
-
-
-def has_pdf_magic_bytes(file_path: Path) -> bool:
-    """
-    Check if file starts with PDF magic bytes.
-
-    Args:
-        file_path: Path to file
-
-    Returns:
-        True if file starts with %PDF-
-    """
-    try:
-        with open(file_path, 'rb') as f:
-            header = f.read(8)
-            return header.startswith(b'%PDF-')
-    except (IOError, OSError):
-        return False
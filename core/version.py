@@ -10,16 +10,22 @@ __author__ = "Your Organization"
 __description__ = "Enterprise-ready desktop application for merging PDF files"
 
 
+# Derived values, computed once since the version never changes at runtime
+_VERSION_TUPLE = tuple(int(x) for x in __version__.split("."))
+_VERSION_STRING = f"v{__version__}"
+_FULL_APP_TITLE = f"{__app_name__} {_VERSION_STRING}"
+
+
 def get_version_tuple():
     """Return version as a tuple of integers."""
-    return tuple(int(x) for x in __version__.split("."))
+    return _VERSION_TUPLE
 
 
 def get_version_string():
     """Return formatted version string."""
-    return f"v{__version__}"
+    return _VERSION_STRING
 
 
 def get_full_app_title():
     """Return full application title with version."""
-    return f"{__app_name__} {get_version_string()}"
+    return _FULL_APP_TITLE
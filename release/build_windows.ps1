@@ -84,7 +84,7 @@ if (-not $SkipVenv) {
 
     if (-not $?) {
         Write-Host "ERROR: Failed to create virtual environment" -ForegroundColor Red
-        Write-Host "Make sure Python 3.9+ is installed and on PATH" -ForegroundColor Red
+        Write-Host "Make sure Python 3.10+ is installed and on PATH" -ForegroundColor Red
         exit 1
     }
 }
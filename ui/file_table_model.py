@@ -0,0 +1,226 @@
+"""
+Table model exposing the merge queue to the main window's file table.
+"""
+from typing import Iterable, List, Optional
+
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QByteArray, QMimeData, QModelIndex,
+    QObject
+)
+from PySide6.QtGui import QColor
+
+from ..core.models import QueuedPDF, FileStatus
+
+
+# Column headers, in display order
+HEADERS = ("#", "File Name", "Source Path", "Size", "Pages", "Status")
+
+# Text alignment of the numeric columns (order, size, pages)
+_COLUMN_ALIGNMENT = {
+    0: Qt.AlignCenter,
+    3: Qt.AlignRight | Qt.AlignVCenter,
+    4: Qt.AlignCenter,
+}
+
+# Status column text color; statuses not listed use the default
+_STATUS_COLORS = {
+    FileStatus.READY: QColor(Qt.darkGreen),
+    FileStatus.ERROR: QColor(Qt.red),
+    FileStatus.CORRUPT: QColor(Qt.red),
+    FileStatus.NOT_PDF: QColor(Qt.red),
+    FileStatus.ENCRYPTED: QColor(Qt.darkYellow),
+    FileStatus.SKIPPED: QColor(Qt.gray),
+}
+
+# MIME type of rows dragged within the table
+_ROWS_MIME_TYPE = "application/x-pdfconsolidator-rows"
+
+
+class QueuedPDFTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of queued files.
+
+    Cell text is produced on demand from the QueuedPDF objects, so no
+    per-cell items exist and the view only asks for visible rows. The
+    model shares the caller's list; after changing it, call refresh()
+    (or refresh_rows() for in-place updates of a few files).
+    """
+
+    files_reordered = Signal()  # Rows were moved by drag and drop
+
+    def __init__(self, files: List[QueuedPDF], parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._files = files
+        self._row_count = len(files)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self._files):
+            return None
+        col = index.column()
+        pdf = self._files[row]
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(row + 1)
+            elif col == 1:
+                return pdf.file_name
+            elif col == 2:
+                return pdf.ellipsized_path(40)
+            elif col == 3:
+                return pdf.size_display
+            elif col == 4:
+                return pdf.page_count_display
+            elif col == 5:
+                return pdf.status_display
+        elif role == Qt.TextAlignmentRole:
+            alignment = _COLUMN_ALIGNMENT.get(col)
+            if alignment is not None:
+                return int(alignment)
+        elif role == Qt.ForegroundRole:
+            if col == 5:
+                return _STATUS_COLORS.get(pdf.status)
+        elif role == Qt.ToolTipRole:
+            if col == 2:
+                return str(pdf.file_path.parent)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            # Drops land between rows, never on top of one
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    # === Updates ===
+
+    def refresh(self, files: Optional[List[QueuedPDF]] = None):
+        """
+        Bring the view in line with the file list after it changed.
+
+        Args:
+            files: New list to show, or None to keep the current one
+        """
+        if files is None:
+            files = self._files
+        if files is self._files and len(files) == self._row_count:
+            # Same rows, possibly reordered or updated: repaint the cells
+            if self._row_count:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(self._row_count - 1, len(HEADERS) - 1)
+                )
+            return
+        self.beginResetModel()
+        self._files = files
+        self._row_count = len(files)
+        self.endResetModel()
+
+    def append_files(self, pdfs: List[QueuedPDF]):
+        """Append files to the list, inserting only their rows."""
+        if not pdfs:
+            return
+        start = len(self._files)
+        self.beginInsertRows(QModelIndex(), start, start + len(pdfs) - 1)
+        self._files.extend(pdfs)
+        self._row_count = len(self._files)
+        self.endInsertRows()
+
+    def move_row(self, src: int, dest: int):
+        """Move one file from row src to row dest, keeping its selection."""
+        if src == dest:
+            return
+        # Qt wants the destination as the row the file is inserted before
+        self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dest + 1 if dest > src else dest)
+        self._files.insert(dest, self._files.pop(src))
+        self.endMoveRows()
+
+    def remove_rows(self, rows: Iterable[int]) -> List[QueuedPDF]:
+        """
+        Remove files by row, one contiguous run of rows at a time.
+
+        Returns:
+            The removed files
+        """
+        removed: List[QueuedPDF] = []
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            # Extend the run downwards while the rows stay contiguous
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            i += 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self._files[first:last + 1])
+            del self._files[first:last + 1]
+            self._row_count = len(self._files)
+            self.endRemoveRows()
+        return removed
+
+    def refresh_rows(self, rows: Iterable[int]):
+        """Repaint the given rows after their files changed in place."""
+        rows = list(rows)
+        if not rows:
+            return
+        # One signal spanning all the rows; the view only repaints the
+        # visible part of the span
+        self.dataChanged.emit(
+            self.index(min(rows), 0),
+            self.index(max(rows), len(HEADERS) - 1)
+        )
+
+    # === Drag and drop reordering ===
+
+    def supportedDropActions(self) -> Qt.DropActions:
+        return Qt.MoveAction
+
+    def mimeTypes(self) -> List[str]:
+        return [_ROWS_MIME_TYPE]
+
+    def mimeData(self, indexes: List[QModelIndex]) -> QMimeData:
+        rows = sorted({index.row() for index in indexes})
+        data = QMimeData()
+        data.setData(_ROWS_MIME_TYPE, QByteArray(",".join(map(str, rows)).encode()))
+        return data
+
+    def dropMimeData(
+        self,
+        data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: QModelIndex
+    ) -> bool:
+        if action != Qt.MoveAction or not data.hasFormat(_ROWS_MIME_TYPE):
+            return False
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self._files)
+
+        rows = [int(r) for r in bytes(data.data(_ROWS_MIME_TYPE)).decode().split(",") if r]
+        moving = set(rows)
+        self.layoutAboutToBeChanged.emit()
+        kept = [pdf for i, pdf in enumerate(self._files) if i not in moving]
+        dest = row - sum(1 for r in rows if r < row)
+        self._files[:] = kept[:dest] + [self._files[r] for r in rows] + kept[dest:]
+        self.layoutChanged.emit()
+        self.files_reordered.emit()
+
+        # The rows were moved here; returning False stops the view from
+        # also removing the dragged source rows
+        return False
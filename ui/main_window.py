@@ -2,20 +2,24 @@
 Main window for PDF Consolidator application.
 """
 import os
-import subprocess
 import sys
+import threading
+import time
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Iterable, List, Optional, Dict, Set, Tuple, TYPE_CHECKING
 
 from PySide6.QtCore import (
     Qt, Signal, Slot, QThread, QObject, QModelIndex,
-    QRunnable, QThreadPool
+    QRunnable, QThreadPool, QTimer, QUrl
+)
+from PySide6.QtGui import (
+    QAction, QClipboard, QDesktopServices, QIcon, QKeySequence, QShortcut
 )
-from PySide6.QtGui import QAction, QClipboard, QIcon, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox,
+    QTableView, QHeaderView, QFileDialog, QMessageBox,
     QGroupBox, QLineEdit, QCheckBox, QComboBox, QSplitter, QFrame,
     QAbstractItemView, QApplication, QProgressBar, QToolButton, QMenu,
     QSizePolicy, QRadioButton, QButtonGroup, QDialog
@@ -25,20 +29,15 @@ from ..core.models import (
     QueuedPDF, FileStatus, MergeResult, MergeProgress,
     EncryptionHandlingMode, SortMode
 )
-from ..core.merge_service import MergeService, create_merge_service
-from ..core.pdf_probe import validate_and_update_queued_pdf
 from ..core.settings import (
     get_settings, get_settings_manager, AppSettings,
     get_log_path, get_app_data_dir
 )
 from ..core.utils import (
     generate_output_filename, find_pdfs_in_directory, normalize_path,
-    compute_sha256, find_unique_path, is_removable_drive
+    find_unique_path, is_removable_drive, compute_content_hash
 )
 from ..core.sanitize import get_logger, sanitize_path_for_log
-from ..core.support_bundle import (
-    create_support_bundle, BundleVerificationError
-)
 from ..core.version import __version__, get_full_app_title
 
 from .widgets import (
@@ -46,10 +45,48 @@ from .widgets import (
     LogViewerDialog, DuplicateDialog, OutputConflictDialog,
     AllowedDirectoriesDialog, SupportBundleDialog, AboutDialog
 )
+from .file_table_model import QueuedPDFTableModel
+from .styles import APP_QSS, VERSION_TEXT_COLOR, set_text_color
+
+# merge_service, pdf_probe (and with them pypdf) and support_bundle are
+# imported where first used so they stay off the startup path
+if TYPE_CHECKING:
+    from ..core.merge_service import MergeService
 
 
 logger = get_logger()
 
+# Most threads the shared QThreadPool runs at once (file probes)
+POOL_MAX_THREADS = 8
+
+# Key sequences shared by the menu actions and window shortcuts, parsed once.
+# Standard keys (QKeySequence.Delete) depend on the platform theme, so those
+# are left as StandardKey values rather than built before the app exists
+_SEQ_ADD_FILES = QKeySequence("Ctrl+O")
+_SEQ_ADD_FOLDER = QKeySequence("Ctrl+Shift+O")
+_SEQ_MERGE = QKeySequence("Ctrl+M")
+_SEQ_EXIT = QKeySequence("Alt+F4")
+_SEQ_ABOUT = QKeySequence("F1")
+
+# Minimum time (ms) between status bar / move button refreshes
+UI_REFRESH_INTERVAL_MS = 50
+
+# Most of the end of the log file (bytes) shown in the log viewer
+LOG_VIEW_MAX_BYTES = 256 * 1024
+
+# Settings values <-> sort combo / encryption radio button ids
+_SORT_MODE_TO_INDEX = {"manual": 0, "filename": 1, "modified_time": 2}
+_INDEX_TO_SORT_MODE = {i: mode for mode, i in _SORT_MODE_TO_INDEX.items()}
+_ENC_MODE_TO_INDEX = {"skip": 0, "prompt_each": 1, "single_password": 2}
+_INDEX_TO_ENC_MODE = {i: mode for mode, i in _ENC_MODE_TO_INDEX.items()}
+
+# Encryption radio button id -> handling mode
+_ENCRYPTION_MODES = {
+    0: EncryptionHandlingMode.SKIP,
+    1: EncryptionHandlingMode.PROMPT_EACH,
+    2: EncryptionHandlingMode.SINGLE_PASSWORD,
+}
+
 
 class MergeWorker(QObject):
     """
@@ -57,15 +94,15 @@ class MergeWorker(QObject):
     """
 
     progress = Signal(float, str, str)  # percent, status, current_file
-    # Emit result data as primitives to avoid cross-thread object marshaling issues
-    # (success, merged, skipped, errors, pages, size_bytes, duration, output_path, error_msg)
-    finished = Signal(bool, int, int, int, int, int, float, str, str)
+    # The MergeResult itself: a plain Python object crosses the queued
+    # connection as a single reference, with no per-field copies
+    finished = Signal(object)  # MergeResult
     error = Signal(str)
     password_requested = Signal(str)  # filename
 
     def __init__(
         self,
-        service: MergeService,
+        service: "MergeService",
         files: List[QueuedPDF],
         output_path: Path,
         passwords: Optional[Dict[str, str]] = None
@@ -85,25 +122,16 @@ class MergeWorker(QObject):
                 self.progress.emit(p.percent_complete, p.status_message, p.current_file)
 
             logger.info("MergeWorker: Starting merge...")
-            result = self.service.merge(
+            # Merge in a child process so pypdf work doesn't contend with the
+            # UI thread for the GIL; this thread just relays its progress
+            result = self.service.merge_in_subprocess(
                 self.files,
                 self.output_path,
                 progress_callback=progress_callback,
                 passwords=self.passwords
             )
             logger.info(f"MergeWorker: Merge returned - success={result.success}, merged={result.merged_count}, pages={result.total_pages}")
-            # Emit result data as primitives
-            self.finished.emit(
-                result.success,
-                result.merged_count,
-                result.skipped_count,
-                result.error_count,
-                result.total_pages,
-                result.total_size_bytes,
-                result.duration_seconds,
-                str(result.output_path) if result.output_path else "",
-                result.error_message
-            )
+            self.finished.emit(result)
             logger.info("MergeWorker: Signal emitted")
         except Exception as e:
             logger.exception("Merge worker error")
@@ -114,62 +142,256 @@ class MergeWorker(QObject):
         self.service.cancel()
 
 
-class ValidationWorker(QObject):
+class BundleWorker(QObject):
     """
-    Worker for validating files in background.
+    Worker for building a support bundle in a background thread.
     """
 
-    progress = Signal(int, int, str)  # current, total, filename
-    file_validated = Signal(int, object)  # index, QueuedPDF
-    finished = Signal()
+    finished = Signal(object)  # Path of the created bundle
+    error = Signal(object)  # The exception that stopped the bundle
 
-    def __init__(self, files: List[QueuedPDF], skip_encrypted: bool = True):
+    def __init__(self, dest_path: Path):
         super().__init__()
+        self.dest_path = dest_path
+
+    @Slot()
+    def run(self):
+        """Create the bundle."""
+        from ..core.support_bundle import (
+            create_support_bundle, BundleVerificationError
+        )
+        try:
+            bundle_path = create_support_bundle(self.dest_path)
+        except BundleVerificationError as e:
+            logger.error(f"Support bundle verification failed: {e}")
+            self.error.emit(e)
+        except Exception as e:
+            logger.exception("Support bundle creation failed")
+            self.error.emit(e)
+        else:
+            logger.info(f"Support bundle exported: {sanitize_path_for_log(bundle_path)}")
+            self.finished.emit(bundle_path)
+
+
+class ProbeRunnable(QRunnable):
+    """
+    Runnable probing a single queued file on the global thread pool.
+
+    One open of the file yields its status, encryption state and page
+    count together, so no separate page-count pass is needed. A mergeable
+    file whose size another queued file shares is then hashed, for the
+    duplicate check; with validate=False it is only hashed.
+    """
+
+    def __init__(
+        self,
+        coordinator: "ProbeCoordinator",
+        index: int,
+        pdf: QueuedPDF,
+        skip_encrypted: bool,
+        validate: bool = True
+    ):
+        super().__init__()
+        self.coordinator = coordinator
+        self.index = index
+        self.pdf = pdf
+        self.skip_encrypted = skip_encrypted
+        self.validate = validate
+        self.setAutoDelete(True)
+
+    def run(self):
+        """Probe the file and report back to the coordinator."""
+        if not self.coordinator.is_cancelled():
+            from ..core.pdf_probe import validate_and_update_queued_pdf
+            try:
+                if self.validate:
+                    validate_and_update_queued_pdf(self.pdf, self.skip_encrypted)
+                self._hash_if_needed()
+            except Exception:
+                logger.exception("Probe error")
+        self.coordinator.report(self.index, self.pdf)
+
+    def _hash_if_needed(self):
+        """Hash the file if it is mergeable and its size isn't unique."""
+        pdf = self.pdf
+        if (
+            pdf.status != FileStatus.READY
+            or pdf.content_hash is not None
+            or pdf.size_bytes not in self.coordinator.hash_sizes
+        ):
+            return
+        try:
+            pdf.content_hash = compute_content_hash(pdf.file_path)
+        except OSError as e:
+            logger.warning(f"Could not hash {sanitize_path_for_log(pdf.file_path)}: {e}")
+
+
+class ProbeCoordinator(QObject):
+    """
+    Fans probing of a batch of files out over the global thread pool.
+
+    Each file is probed by its own ProbeRunnable. Results are collected
+    from the pool threads and sent to the UI thread in batches of up to
+    REPORT_BATCH_SIZE files, or at least every REPORT_INTERVAL seconds,
+    rather than one queued signal per file. finished fires once all
+    files are done, even after cancel().
+
+    hash_sizes is the window's live set of file sizes shared by more than
+    one queued file; hash_files are files probed earlier that only need
+    hashing, now that their size is shared.
+    """
+
+    # Largest number of files in one files_probed batch
+    REPORT_BATCH_SIZE = 16
+
+    # Longest time (seconds) a completed file waits to be reported
+    REPORT_INTERVAL = 0.05
+
+    progress = Signal(int, int, str)  # completed, total, filename
+    files_probed = Signal(list)  # [(index, QueuedPDF), ...]
+    finished = Signal()
+
+    # Emitted from pool threads; always queued to _on_batch_done here
+    batch_done = Signal(list)
+    # Emitted from pool threads when a file starts waiting in _pending;
+    # queued to _schedule_flush, since pool threads can't start timers
+    flush_requested = Signal()
+
+    def __init__(
+        self,
+        files: List[QueuedPDF],
+        skip_encrypted: bool = True,
+        hash_sizes: Optional[Set[int]] = None,
+        hash_files: Optional[List[QueuedPDF]] = None,
+        parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
         self.files = files
+        self.hash_files = hash_files or []
+        self.hash_sizes = hash_sizes if hash_sizes is not None else set()
         self.skip_encrypted = skip_encrypted
+        self._total = len(files) + len(self.hash_files)
+        self._completed = 0
         self._cancelled = False
+        # Shared with the pool threads, guarded by _lock
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, QueuedPDF]] = []
+        self._reported = 0
+        self._last_flush = time.monotonic()
+        self.batch_done.connect(self._on_batch_done, Qt.QueuedConnection)
+        self.flush_requested.connect(self._schedule_flush, Qt.QueuedConnection)
+        # Sends files left waiting when no further report comes along
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(int(self.REPORT_INTERVAL * 1000))
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+    def start(self):
+        """Queue a runnable per file."""
+        if not self._total:
+            self.finished.emit()
+            return
+        pool = QThreadPool.globalInstance()
+        for i, pdf in enumerate(self.files):
+            pool.start(ProbeRunnable(self, i, pdf, self.skip_encrypted))
+        for i, pdf in enumerate(self.hash_files, len(self.files)):
+            pool.start(ProbeRunnable(self, i, pdf, self.skip_encrypted, validate=False))
+
+    def report(self, index: int, pdf: QueuedPDF):
+        """Record a finished file; called from pool threads."""
+        with self._lock:
+            self._pending.append((index, pdf))
+            self._reported += 1
+            now = time.monotonic()
+            if (
+                len(self._pending) < self.REPORT_BATCH_SIZE
+                and now - self._last_flush < self.REPORT_INTERVAL
+                and self._reported < self._total
+            ):
+                if len(self._pending) == 1:
+                    # Sent by the flush timer if no other report comes first
+                    self.flush_requested.emit()
+                return
+            batch, self._pending = self._pending, []
+            self._last_flush = now
+        self.batch_done.emit(batch)
 
     @Slot()
-    def run(self):
-        """Run validation."""
-        total = len(self.files)
-        for i, pdf in enumerate(self.files):
-            if self._cancelled:
-                break
-            self.progress.emit(i + 1, total, pdf.file_name)
-            validate_and_update_queued_pdf(pdf, self.skip_encrypted)
-            self.file_validated.emit(i, pdf)
-        self.finished.emit()
+    def _schedule_flush(self):
+        """Flush held files after REPORT_INTERVAL unless a report does first."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush_pending(self):
+        """Send the files still held in _pending."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if batch:
+                self._last_flush = time.monotonic()
+        if batch:
+            self._on_batch_done(batch)
+
+    @Slot(list)
+    def _on_batch_done(self, batch: List[Tuple[int, QueuedPDF]]):
+        """Count a batch of completed files and relay it unless cancelled."""
+        self._completed += len(batch)
+        if not self._cancelled:
+            self.progress.emit(self._completed, self._total, batch[-1][1].file_name)
+            self.files_probed.emit(batch)
+        if self._completed == self._total:
+            self.finished.emit()
+
+    def is_cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._cancelled
 
     def cancel(self):
-        """Cancel validation."""
+        """Cancel probing; files not yet started are skipped."""
         self._cancelled = True
 
 
-class PageCountRunnable(QRunnable):
-    """
-    Runnable for lazy page count detection.
+class FolderScanSignals(QObject):
+    """Signals of a FolderScanRunnable (QRunnable itself can't emit)."""
+
+    found = Signal(list)  # [Path, ...], the PDFs of one folder
+    finished = Signal(int)  # total PDFs found
+
+
+class FolderScanRunnable(QRunnable):
     """
+    Runnable searching folders for PDFs on the global thread pool.
 
-    class Signals(QObject):
-        finished = Signal(int, int)  # index, page_count
+    Each folder's PDFs are sent back as soon as that folder is scanned,
+    in the sorted order find_pdfs_in_directory returns, so a slow
+    network folder neither freezes the window nor holds back the others.
+    """
 
-    def __init__(self, index: int, file_path: Path):
+    def __init__(
+        self,
+        folders: List[Path],
+        include_subfolders: bool,
+        parent: Optional[QObject] = None
+    ):
         super().__init__()
-        self.index = index
-        self.file_path = file_path
-        self.signals = self.Signals()
+        self.folders = folders
+        self.include_subfolders = include_subfolders
+        self.signals = FolderScanSignals(parent)
         self.setAutoDelete(True)
 
     def run(self):
-        """Get page count for file."""
-        try:
-            from ..core.pdf_probe import probe_pdf
-            is_valid, page_count, _ = probe_pdf(self.file_path, check_encryption=False)
-            if is_valid and page_count is not None:
-                self.signals.finished.emit(self.index, page_count)
-        except Exception:
-            pass  # Silently fail for page count
+        """Scan the folders and report their PDFs."""
+        total = 0
+        for folder in self.folders:
+            try:
+                pdfs = find_pdfs_in_directory(folder, self.include_subfolders)
+            except Exception:
+                logger.exception("Folder scan error")
+                continue
+            if pdfs:
+                total += len(pdfs)
+                self.signals.found.emit(pdfs)
+        self.signals.finished.emit(total)
 
 
 class MainWindow(QMainWindow):
@@ -184,11 +406,30 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle(get_full_app_title())
         self.queued_files: List[QueuedPDF] = []
+        # str(file_path) -> row in queued_files, rebuilt whenever it changes
+        self._path_to_index: Dict[str, int] = {}
+        # Resolved paths of queued_files, for duplicate checks on add
+        self._normalized_paths: Set[str] = set()
+        # Sizes of files queued since the last clear, and those seen more
+        # than once; only files of a shared size are hashed
+        self._queued_sizes: Set[int] = set()
+        self._hash_sizes: Set[int] = set()
         self.merge_thread: Optional[QThread] = None
         self.merge_worker: Optional[MergeWorker] = None
-        self.validation_thread: Optional[QThread] = None
-        self.page_count_pool = QThreadPool()
-        self.page_count_pool.setMaxThreadCount(2)  # Low priority
+        self.progress_dialog: Optional[ProgressDialog] = None
+        self.bundle_thread: Optional[QThread] = None
+        self.bundle_worker: Optional[BundleWorker] = None
+        self.bundle_dialog: Optional[ProgressDialog] = None
+        self.probe_coordinator: Optional[ProbeCoordinator] = None
+        pool = QThreadPool.globalInstance()
+        pool.setMaxThreadCount(min(POOL_MAX_THREADS, QThread.idealThreadCount()))
+
+        # Status bar and move button refreshes are coalesced: requests made
+        # while a timer is pending are covered by that timer's refresh
+        self._status_timer = self._create_refresh_timer(self._flush_status)
+        self._selection_timer = self._create_refresh_timer(self._flush_selection)
+
+        self._clipboard: QClipboard = QApplication.clipboard()
 
         self._setup_ui()
         self._setup_shortcuts()
@@ -230,8 +471,13 @@ class MainWindow(QMainWindow):
         output_group = self._create_output_section()
         main_layout.addWidget(output_group)
 
-        # Advanced options (collapsible)
-        self.advanced_group = self._create_advanced_options()
+        # Advanced options (collapsible); its widgets are only built the
+        # first time it is expanded, see _populate_advanced_options
+        self.advanced_group = QGroupBox("Advanced Options")
+        self.advanced_group.setCheckable(True)
+        self.advanced_group.setChecked(False)
+        self._advanced_populated = False
+        self.advanced_group.toggled.connect(self._on_advanced_toggled)
         main_layout.addWidget(self.advanced_group)
 
         # Bottom status bar
@@ -253,26 +499,26 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("&File")
 
         add_files_action = QAction("&Add Files...", self)
-        add_files_action.setShortcut("Ctrl+O")
+        add_files_action.setShortcut(_SEQ_ADD_FILES)
         add_files_action.triggered.connect(self._on_add_files)
         file_menu.addAction(add_files_action)
 
         add_folder_action = QAction("Add &Folder...", self)
-        add_folder_action.setShortcut("Ctrl+Shift+O")
+        add_folder_action.setShortcut(_SEQ_ADD_FOLDER)
         add_folder_action.triggered.connect(self._on_add_folder)
         file_menu.addAction(add_folder_action)
 
         file_menu.addSeparator()
 
         merge_action = QAction("&Merge PDFs", self)
-        merge_action.setShortcut("Ctrl+M")
+        merge_action.setShortcut(_SEQ_MERGE)
         merge_action.triggered.connect(self._on_merge)
         file_menu.addAction(merge_action)
 
         file_menu.addSeparator()
 
         exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Alt+F4")
+        exit_action.setShortcut(_SEQ_EXIT)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
@@ -280,7 +526,7 @@ class MainWindow(QMainWindow):
         help_menu = menubar.addMenu("&Help")
 
         about_action = QAction("&About / Support...", self)
-        about_action.setShortcut("F1")
+        about_action.setShortcut(_SEQ_ABOUT)
         about_action.triggered.connect(self._show_about_dialog)
         help_menu.addAction(about_action)
 
@@ -297,11 +543,11 @@ class MainWindow(QMainWindow):
     def _setup_shortcuts(self):
         """Set up keyboard shortcuts."""
         # Ctrl+O: Add Files
-        shortcut_add_files = QShortcut(QKeySequence("Ctrl+O"), self)
+        shortcut_add_files = QShortcut(_SEQ_ADD_FILES, self)
         shortcut_add_files.activated.connect(self._on_add_files)
 
         # Ctrl+Shift+O: Add Folder
-        shortcut_add_folder = QShortcut(QKeySequence("Ctrl+Shift+O"), self)
+        shortcut_add_folder = QShortcut(_SEQ_ADD_FOLDER, self)
         shortcut_add_folder.activated.connect(self._on_add_folder)
 
         # Delete: Remove selected
@@ -309,7 +555,7 @@ class MainWindow(QMainWindow):
         shortcut_delete.activated.connect(self._on_remove_selected)
 
         # Ctrl+M: Merge
-        shortcut_merge = QShortcut(QKeySequence("Ctrl+M"), self)
+        shortcut_merge = QShortcut(_SEQ_MERGE, self)
         shortcut_merge.activated.connect(self._on_merge)
 
     def _create_header(self) -> QWidget:
@@ -320,18 +566,14 @@ class MainWindow(QMainWindow):
 
         # Title
         title = QLabel(self.APP_NAME)
-        title.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #212529;
-        """)
+        title.setProperty("role", "title")
         layout.addWidget(title)
 
         layout.addStretch()
 
         # Version
         version = QLabel(f"v{self.APP_VERSION}")
-        version.setStyleSheet("color: #6c757d;")
+        set_text_color(version, VERSION_TEXT_COLOR)
         layout.addWidget(version)
 
         # Support bundle button
@@ -382,33 +624,17 @@ class MainWindow(QMainWindow):
 
         self.merge_btn = QPushButton("  Merge PDFs  ")
         self.merge_btn.setToolTip("Merge all valid PDFs (Ctrl+M)")
-        self.merge_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0d6efd;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #0b5ed7;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        self.merge_btn.setProperty("role", "primary")
         layout.addWidget(self.merge_btn)
 
         return layout
 
-    def _create_file_table(self) -> QTableWidget:
+    def _create_file_table(self) -> QTableView:
         """Create file list table."""
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "#", "File Name", "Source Path", "Size", "Pages", "Status"
-        ])
+        table = QTableView()
+        self.file_model = QueuedPDFTableModel(self.queued_files, self)
+        self.file_model.files_reordered.connect(self._on_files_reordered)
+        table.setModel(self.file_model)
 
         # Set column properties
         header = table.horizontalHeader()
@@ -424,12 +650,19 @@ class MainWindow(QMainWindow):
         table.setColumnWidth(4, 60)
         table.setColumnWidth(5, 100)
 
+        # Every row has the same height, so the view never measures cell
+        # contents to lay rows out
+        rows = table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(table.fontMetrics().height() + 10)
+
         # Selection and drag behavior
         table.setSelectionBehavior(QAbstractItemView.SelectRows)
         table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         table.setDragEnabled(True)
         table.setAcceptDrops(True)
         table.setDragDropMode(QAbstractItemView.InternalMove)
+        table.setDragDropOverwriteMode(False)
         table.setDefaultDropAction(Qt.MoveAction)
 
         # Alternating row colors
@@ -475,12 +708,14 @@ class MainWindow(QMainWindow):
 
         return group
 
-    def _create_advanced_options(self) -> QGroupBox:
-        """Create advanced options section."""
-        group = QGroupBox("Advanced Options")
-        group.setCheckable(True)
-        group.setChecked(False)
+    def _populate_advanced_options(self, group: QGroupBox):
+        """
+        Build the advanced options widgets into their group box.
 
+        Until this runs the options are read from the saved settings; the
+        widgets start out showing those same values.
+        """
+        self._advanced_populated = True
         layout = QVBoxLayout(group)
 
         # Row 1: Sort mode with Sort Now button
@@ -571,71 +806,39 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(row4)
 
-        return group
+        self._load_advanced_settings()
+
+        self.sort_now_btn.clicked.connect(self._on_sort_now)
+        self.sort_combo.currentIndexChanged.connect(self._on_sort_mode_changed)
+        self.restrict_output_check.toggled.connect(
+            lambda checked: self.manage_dirs_btn.setEnabled(checked)
+        )
+
+    def _advanced_checked(self, check_name: str, setting_name: str) -> bool:
+        """Get an advanced option checkbox, or its setting if not yet built."""
+        if self._advanced_populated:
+            return getattr(self, check_name).isChecked()
+        return getattr(get_settings(), setting_name)
+
+    def _sort_mode_index(self) -> int:
+        """Get the sort combo index (0 manual, 1 filename, 2 modified time)."""
+        if self._advanced_populated:
+            return self.sort_combo.currentIndex()
+        return _SORT_MODE_TO_INDEX.get(get_settings().sort_mode, 0)
 
     def _apply_styles(self):
         """Apply application-wide styles."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-            QTableWidget {
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                gridline-color: #e9ecef;
-            }
-            QTableWidget::item {
-                padding: 4px;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                border: none;
-                border-bottom: 1px solid #dee2e6;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QPushButton {
-                padding: 6px 12px;
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                background-color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-            }
-            QPushButton:disabled {
-                color: #adb5bd;
-            }
-            QLineEdit {
-                padding: 6px;
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-            }
-            QComboBox {
-                padding: 6px;
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-            }
-        """)
+        # Set on the application once, not per window, so Qt parses it once
+        app = QApplication.instance()
+        if app.styleSheet() != APP_QSS:
+            app.setStyleSheet(APP_QSS)
 
     def _connect_signals(self):
         """Connect UI signals to slots."""
         # Drop zone
-        self.drop_zone.files_dropped.connect(self._on_files_dropped)
-        self.drop_zone.folders_dropped.connect(self._on_folders_dropped)
-        self.drop_zone.clicked.connect(self._on_add_files)
+        self.drop_zone.files_dropped.connect(self._on_files_dropped, Qt.DirectConnection)
+        self.drop_zone.folders_dropped.connect(self._on_folders_dropped, Qt.DirectConnection)
+        self.drop_zone.clicked.connect(self._on_add_files, Qt.DirectConnection)
 
         # Buttons
         self.add_files_btn.clicked.connect(self._on_add_files)
@@ -645,17 +848,10 @@ class MainWindow(QMainWindow):
         self.browse_output_btn.clicked.connect(self._on_browse_output)
         self.move_up_btn.clicked.connect(self._on_move_up)
         self.move_down_btn.clicked.connect(self._on_move_down)
-        self.sort_now_btn.clicked.connect(self._on_sort_now)
 
         # Table selection
-        self.file_table.itemSelectionChanged.connect(self._on_selection_changed)
-
-        # Sort combo
-        self.sort_combo.currentIndexChanged.connect(self._on_sort_mode_changed)
-
-        # Output restriction toggle
-        self.restrict_output_check.toggled.connect(
-            lambda checked: self.manage_dirs_btn.setEnabled(checked)
+        self.file_table.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
         )
 
     def _check_first_run(self):
@@ -743,9 +939,15 @@ Usernames are automatically removed from logged file paths.</p>
         self.filename_edit.setText(settings.output_filename_template)
         self.open_folder_check.setChecked(settings.open_folder_after_merge)
 
+        # Expanding the group builds and loads the advanced options
+        self.advanced_group.setChecked(settings.show_advanced_options)
+
+    def _load_advanced_settings(self):
+        """Load saved settings into the advanced options widgets."""
+        settings = get_settings()
+
         # Sort mode
-        sort_modes = {"manual": 0, "filename": 1, "modified_time": 2}
-        self.sort_combo.setCurrentIndex(sort_modes.get(settings.sort_mode, 0))
+        self.sort_combo.setCurrentIndex(_SORT_MODE_TO_INDEX.get(settings.sort_mode, 0))
         self._on_sort_mode_changed(self.sort_combo.currentIndex())
 
         self.subfolders_check.setChecked(settings.include_subfolders)
@@ -754,8 +956,7 @@ Usernames are automatically removed from logged file paths.</p>
         self.hash_files_check.setChecked(settings.enable_file_hashing)
 
         # Encryption mode
-        enc_modes = {"skip": 0, "prompt_each": 1, "single_password": 2}
-        enc_mode = enc_modes.get(settings.encryption_handling_mode, 0)
+        enc_mode = _ENC_MODE_TO_INDEX.get(settings.encryption_handling_mode, 0)
         self.encryption_group.button(enc_mode).setChecked(True)
 
         # Output restrictions
@@ -763,8 +964,6 @@ Usernames are automatically removed from logged file paths.</p>
         self.manage_dirs_btn.setEnabled(settings.restrict_output_directories)
         self.block_removable_check.setChecked(settings.block_removable_drives)
 
-        self.advanced_group.setChecked(settings.show_advanced_options)
-
     def _save_settings(self):
         """Save current settings."""
         manager = get_settings_manager()
@@ -774,23 +973,25 @@ Usernames are automatically removed from logged file paths.</p>
         settings.output_filename_template = self.filename_edit.text()
         settings.open_folder_after_merge = self.open_folder_check.isChecked()
 
-        sort_modes = {0: "manual", 1: "filename", 2: "modified_time"}
-        settings.sort_mode = sort_modes.get(self.sort_combo.currentIndex(), "manual")
+        # Advanced options never built keep their loaded values
+        if self._advanced_populated:
+            settings.sort_mode = _INDEX_TO_SORT_MODE.get(
+                self.sort_combo.currentIndex(), "manual"
+            )
 
-        settings.include_subfolders = self.subfolders_check.isChecked()
-        settings.normalize_metadata = self.normalize_metadata_check.isChecked()
-        settings.generate_summary_report = self.generate_report_check.isChecked()
-        settings.enable_file_hashing = self.hash_files_check.isChecked()
+            settings.include_subfolders = self.subfolders_check.isChecked()
+            settings.normalize_metadata = self.normalize_metadata_check.isChecked()
+            settings.generate_summary_report = self.generate_report_check.isChecked()
+            settings.enable_file_hashing = self.hash_files_check.isChecked()
 
-        # Encryption mode
-        enc_modes = {0: "skip", 1: "prompt_each", 2: "single_password"}
-        settings.encryption_handling_mode = enc_modes.get(
-            self.encryption_group.checkedId(), "skip"
-        )
+            # Encryption mode
+            settings.encryption_handling_mode = _INDEX_TO_ENC_MODE.get(
+                self.encryption_group.checkedId(), "skip"
+            )
 
-        # Output restrictions
-        settings.restrict_output_directories = self.restrict_output_check.isChecked()
-        settings.block_removable_drives = self.block_removable_check.isChecked()
+            # Output restrictions
+            settings.restrict_output_directories = self.restrict_output_check.isChecked()
+            settings.block_removable_drives = self.block_removable_check.isChecked()
 
         settings.show_advanced_options = self.advanced_group.isChecked()
 
@@ -807,143 +1008,162 @@ Usernames are automatically removed from logged file paths.</p>
 
     # === File Management ===
 
-    def _add_files(self, file_paths: List[str]):
+    def _add_files(self, file_paths: List[Path]):
         """Add files to the queue."""
-        new_files: List[QueuedPDF] = []
-        existing_paths = {str(f.file_path) for f in self.queued_files}
+        from ..core.pdf_probe import prepare_queue
 
-        for path_str in file_paths:
-            path = Path(path_str)
-            if not path.exists():
-                continue
+        new_paths: List[Path] = []
+        seen_paths = set()
+
+        for path in file_paths:
+            # Compare resolved paths, so other spellings of a queued file
+            # (case, symlinks, relative parts) are caught too
+            norm = str(normalize_path(path))
 
-            # Check for duplicates
-            if str(path) in existing_paths:
+            # Check for duplicates, against the queue and within this batch
+            if norm in self._normalized_paths or norm in seen_paths:
                 continue
 
-            # Create queued item (page_count will be lazy loaded)
-            queued = QueuedPDF(
-                file_path=path,
-                order_index=len(self.queued_files) + len(new_files)
-            )
-            new_files.append(queued)
-            existing_paths.add(str(path))
+            new_paths.append(path)
+            seen_paths.add(norm)
+
+        # Stat and header-check all new files in parallel; unreadable files
+        # come back marked ERROR (page_count is filled in by the probe)
+        new_files = prepare_queue(new_paths, start_index=len(self.queued_files))
 
         if new_files:
-            self.queued_files.extend(new_files)
-            self._refresh_table()
-            self._validate_files(new_files)
-            self._request_lazy_page_counts(new_files)
+            self._append_files(new_files)
+            self._request_probes(new_files)
 
         self._update_status()
 
-    def _validate_files(self, files: List[QueuedPDF]):
-        """Validate files in background."""
-        if not files:
-            return
+    def _scan_folders(
+        self,
+        folders: List[Path],
+        include_subfolders: bool,
+        empty_message: str
+    ):
+        """Search folders for PDFs in background and queue what is found."""
+        scan = FolderScanRunnable(folders, include_subfolders, parent=self)
+        signals = scan.signals
+        signals.found.connect(self._add_files)
+        signals.finished.connect(
+            lambda total: self._on_folder_scan_finished(total, empty_message)
+        )
+        signals.finished.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(scan)
 
-        skip_encrypted = self.encrypt_skip_radio.isChecked()
+    def _on_folder_scan_finished(self, total: int, empty_message: str):
+        """Tell the user when a folder scan found nothing."""
+        logger.info(f"Folder scan found {total} PDFs")
+        if not total:
+            QMessageBox.information(self, "No PDFs Found", empty_message)
 
-        # For small number of files, validate synchronously
-        if len(files) <= 5:
-            for pdf in files:
-                validate_and_update_queued_pdf(pdf, skip_encrypted)
-            self._refresh_table()
+    def _request_probes(self, files: List[QueuedPDF]):
+        """Validate files and count their pages in background."""
+        if not files:
             return
 
-        # For larger numbers, use background thread
-        self.validation_thread = QThread()
-        worker = ValidationWorker(files, skip_encrypted)
-        worker.moveToThread(self.validation_thread)
-
-        self.validation_thread.started.connect(worker.run)
-        worker.file_validated.connect(self._on_file_validated)
-        worker.finished.connect(self.validation_thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        self.validation_thread.finished.connect(self.validation_thread.deleteLater)
-
-        self.validation_thread.start()
-
-    def _request_lazy_page_counts(self, files: List[QueuedPDF]):
-        """Request page counts lazily in background."""
-        for i, pdf in enumerate(files):
-            if pdf.page_count is None:
-                # Find index in main list
-                try:
-                    idx = self.queued_files.index(pdf)
-                    runnable = PageCountRunnable(idx, pdf.file_path)
-                    runnable.signals.finished.connect(self._on_page_count_ready)
-                    self.page_count_pool.start(runnable)
-                except ValueError:
-                    pass
-
-    @Slot(int, int)
-    def _on_page_count_ready(self, index: int, page_count: int):
-        """Handle lazy page count result."""
-        if index < len(self.queued_files):
-            self.queued_files[index].page_count = page_count
-            # Update just the page count cell
-            item = self.file_table.item(index, 4)
-            if item:
-                item.setText(str(page_count))
-            self._update_status()
-
-    def _refresh_table(self):
-        """Refresh the file table display."""
-        self.file_table.setRowCount(len(self.queued_files))
-
+        skip_encrypted = self._get_encryption_mode() == EncryptionHandlingMode.SKIP
+
+        # Sizes this batch shares with another queued file. The set is read
+        # live by probes already running, and files probed earlier that
+        # now share their size are sent to be hashed
+        shared: Set[int] = set()
+        for pdf in files:
+            if pdf.size_bytes in self._queued_sizes:
+                shared.add(pdf.size_bytes)
+            self._queued_sizes.add(pdf.size_bytes)
+        shared -= self._hash_sizes
+        self._hash_sizes |= shared
+        hash_files = [
+            pdf for pdf in self.queued_files
+            if pdf.size_bytes in shared
+            and pdf.status == FileStatus.READY and pdf.content_hash is None
+        ] if shared else []
+
+        # Always validate on the thread pool, however few files, so the UI
+        # thread never blocks on a PDF open. The coordinator is parented to
+        # the window so it outlives its runnables
+        coordinator = ProbeCoordinator(
+            files, skip_encrypted, self._hash_sizes, hash_files, parent=self
+        )
+        coordinator.files_probed.connect(self._on_files_probed)
+        coordinator.finished.connect(coordinator.deleteLater)
+        self.probe_coordinator = coordinator
+        coordinator.start()
+
+    def _reindex(self):
+        """Rebuild the path -> row lookup and order numbers after queued_files changes."""
+        self._path_to_index = {}
         for i, pdf in enumerate(self.queued_files):
             pdf.order_index = i + 1
+            self._path_to_index[str(pdf.file_path)] = i
 
-            # Order number
-            item = QTableWidgetItem(str(i + 1))
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.file_table.setItem(i, 0, item)
-
-            # File name
-            item = QTableWidgetItem(pdf.file_name)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.file_table.setItem(i, 1, item)
-
-            # Source path (ellipsized)
-            item = QTableWidgetItem(pdf.ellipsized_path(40))
-            item.setToolTip(str(pdf.file_path.parent))
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.file_table.setItem(i, 2, item)
-
-            # Size
-            item = QTableWidgetItem(pdf.size_display)
-            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.file_table.setItem(i, 3, item)
-
-            # Page count
-            item = QTableWidgetItem(pdf.page_count_display)
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.file_table.setItem(i, 4, item)
-
-            # Status with color coding
-            item = QTableWidgetItem(pdf.status_display)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-            if pdf.status == FileStatus.READY:
-                item.setForeground(Qt.darkGreen)
-            elif pdf.status in (FileStatus.ERROR, FileStatus.CORRUPT, FileStatus.NOT_PDF):
-                item.setForeground(Qt.red)
-            elif pdf.status == FileStatus.ENCRYPTED:
-                item.setForeground(Qt.darkYellow)
-            elif pdf.status == FileStatus.SKIPPED:
-                item.setForeground(Qt.gray)
-
-            self.file_table.setItem(i, 5, item)
+    def _refresh_table(self):
+        """Bring the whole file table in line with queued_files."""
+        self._reindex()
+        self.file_model.refresh(self.queued_files)
+
+    def _append_files(self, pdfs: List[QueuedPDF]):
+        """Append files to queued_files and add their table rows."""
+        start = len(self.queued_files)
+        for i, pdf in enumerate(pdfs, start):
+            pdf.order_index = i + 1
+            self._path_to_index[str(pdf.file_path)] = i
+            self._normalized_paths.add(pdf.normalized_path)
+        self.file_model.append_files(pdfs)
+
+    def _update_rows(self, rows: Iterable[int]):
+        """Repaint the given table rows."""
+        self.file_model.refresh_rows(rows)
+
+    def _update_files(self, files: List[QueuedPDF]):
+        """Update the table rows of the given queued files."""
+        rows = [self._path_to_index.get(str(pdf.file_path)) for pdf in files]
+        self._update_rows(row for row in rows if row is not None)
+
+    def _swap_rows(self, a: int, b: int):
+        """Swap two adjacent queued files and their table rows."""
+        self.file_model.move_row(a, b)
+        files = self.queued_files
+        for row in (a, b):
+            files[row].order_index = row + 1
+            self._path_to_index[str(files[row].file_path)] = row
+        # The order numbers of both rows changed
+        self._update_rows((a, b))
+
+    def _remove_rows(self, rows: Iterable[int]) -> List[QueuedPDF]:
+        """Remove queued files and their table rows by row."""
+        removed = self.file_model.remove_rows(rows)
+        self._reindex()
+        # Rows below the removed ones show new order numbers
+        self._update_rows(range(len(self.queued_files)))
+        return removed
+
+    def _create_refresh_timer(self, slot) -> QTimer:
+        """Create a single-shot timer for a coalesced UI refresh."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(UI_REFRESH_INTERVAL_MS)
+        timer.timeout.connect(slot)
+        return timer
 
     def _update_status(self):
+        """Schedule a status bar update."""
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    @Slot()
+    def _flush_status(self):
         """Update status bar."""
         total = len(self.queued_files)
-        valid = sum(1 for f in self.queued_files if f.is_valid_for_merge)
-        total_pages = sum(f.page_count or 0 for f in self.queued_files if f.is_valid_for_merge)
+        valid = 0
+        total_pages = 0
+        for f in self.queued_files:
+            if f.is_valid_for_merge:
+                valid += 1
+                total_pages += f.page_count or 0
 
         if total == 0:
             self.status_bar.showMessage("Ready - Add files to begin")
@@ -954,53 +1174,56 @@ Usernames are automatically removed from logged file paths.</p>
             )
             self.merge_btn.setEnabled(valid > 0)
 
+    def _duplicate_rows(self) -> List[int]:
+        """
+        Rows of files whose content already appears in an earlier row.
+
+        Files are compared by the content hash their probe computed, or by
+        normalized path when there is none (unique size, not mergeable,
+        unreadable, or still being probed).
+        """
+        seen = set()
+        rows = []
+        for row, pdf in enumerate(self.queued_files):
+            key = pdf.content_hash or pdf.normalized_path
+            if key in seen:
+                rows.append(row)
+            else:
+                seen.add(key)
+        return rows
+
     def _check_duplicates(self) -> List[str]:
         """Check for duplicate files and return list of duplicates."""
-        seen = set()
-        duplicates = []
-        for pdf in self.queued_files:
-            normalized = str(normalize_path(pdf.file_path))
-            if normalized in seen:
-                duplicates.append(pdf.file_name)
-            seen.add(normalized)
-        return duplicates
-
-    def _remove_duplicates(self):
-        """Remove duplicate files from queue."""
-        seen = set()
-        unique = []
-        for pdf in self.queued_files:
-            normalized = str(normalize_path(pdf.file_path))
-            if normalized not in seen:
-                seen.add(normalized)
-                unique.append(pdf)
-        self.queued_files = unique
-        self._refresh_table()
+        files = self.queued_files
+        return [files[row].file_name for row in self._duplicate_rows()]
+
+    def _remove_duplicates(self) -> List[QueuedPDF]:
+        """Remove duplicate files from queue and return them."""
+        removed = self._remove_rows(self._duplicate_rows())
+        # A removed copy may share its path with the copy that stays
+        self._normalized_paths = {pdf.normalized_path for pdf in self.queued_files}
         self._update_status()
+        return removed
 
     def _sort_files(self):
         """Sort files according to current sort mode."""
-        mode = self.sort_combo.currentIndex()
+        mode = self._sort_mode_index()
 
         if mode == 1:  # Filename
             self.queued_files.sort(key=lambda f: f.file_name.lower())
         elif mode == 2:  # Modified time
-            self.queued_files.sort(
-                key=lambda f: f.modified_time or datetime.min
-            )
+            self.queued_files.sort(key=attrgetter('mtime'))
         # mode 0 = Manual, keep current order
 
         self._refresh_table()
 
     def _get_encryption_mode(self) -> EncryptionHandlingMode:
         """Get current encryption handling mode."""
-        mode_id = self.encryption_group.checkedId()
-        modes = {
-            0: EncryptionHandlingMode.SKIP,
-            1: EncryptionHandlingMode.PROMPT_EACH,
-            2: EncryptionHandlingMode.SINGLE_PASSWORD
-        }
-        return modes.get(mode_id, EncryptionHandlingMode.SKIP)
+        if self._advanced_populated:
+            mode_id = self.encryption_group.checkedId()
+        else:
+            mode_id = _ENC_MODE_TO_INDEX.get(get_settings().encryption_handling_mode, 0)
+        return _ENCRYPTION_MODES.get(mode_id, EncryptionHandlingMode.SKIP)
 
     def _check_output_allowed(self, output_path: Path) -> Tuple[bool, str]:
         """Check if output path is allowed."""
@@ -1029,10 +1252,10 @@ Usernames are automatically removed from logged file paths.</p>
     # === Slots ===
 
     @Slot(list)
-    def _on_files_dropped(self, paths: List[str]):
+    def _on_files_dropped(self, paths: List[Path]):
         """Handle files dropped on drop zone."""
         logger.info(f"Files dropped: {len(paths)} items")
-        pdf_paths = [p for p in paths if p.lower().endswith('.pdf')]
+        pdf_paths = [p for p in paths if p.name[-4:].lower() == '.pdf']
         if pdf_paths:
             self._add_files(pdf_paths)
         elif paths:
@@ -1043,25 +1266,17 @@ Usernames are automatically removed from logged file paths.</p>
             )
 
     @Slot(list)
-    def _on_folders_dropped(self, paths: List[str]):
+    def _on_folders_dropped(self, paths: List[Path]):
         """Handle folders dropped on drop zone."""
         logger.info(f"Folders dropped: {len(paths)} items")
-        include_subfolders = self.subfolders_check.isChecked()
-
-        all_pdfs = []
-        for folder_path in paths:
-            folder = Path(folder_path)
-            pdfs = find_pdfs_in_directory(folder, include_subfolders)
-            all_pdfs.extend([str(p) for p in pdfs])
+        include_subfolders = self._advanced_checked(
+            "subfolders_check", "include_subfolders"
+        )
 
-        if all_pdfs:
-            self._add_files(all_pdfs)
-        else:
-            QMessageBox.information(
-                self,
-                "No PDFs Found",
-                "No PDF files were found in the dropped folder(s)."
-            )
+        self._scan_folders(
+            paths, include_subfolders,
+            "No PDF files were found in the dropped folder(s)."
+        )
 
     @Slot()
     def _on_add_files(self):
@@ -1073,7 +1288,7 @@ Usernames are automatically removed from logged file paths.</p>
             "PDF Files (*.pdf);;All Files (*.*)"
         )
         if files:
-            self._add_files(files)
+            self._add_files([Path(f) for f in files])
 
     @Slot()
     def _on_add_folder(self):
@@ -1085,16 +1300,13 @@ Usernames are automatically removed from logged file paths.</p>
             QFileDialog.ShowDirsOnly
         )
         if folder:
-            include_subfolders = self.subfolders_check.isChecked()
-            pdfs = find_pdfs_in_directory(Path(folder), include_subfolders)
-            if pdfs:
-                self._add_files([str(p) for p in pdfs])
-            else:
-                QMessageBox.information(
-                    self,
-                    "No PDFs Found",
-                    "No PDF files were found in the selected folder."
-                )
+            include_subfolders = self._advanced_checked(
+                "subfolders_check", "include_subfolders"
+            )
+            self._scan_folders(
+                [Path(folder)], include_subfolders,
+                "No PDF files were found in the selected folder."
+            )
 
     @Slot()
     def _on_clear(self):
@@ -1108,6 +1320,9 @@ Usernames are automatically removed from logged file paths.</p>
             )
             if result == QMessageBox.Yes:
                 self.queued_files.clear()
+                self._normalized_paths.clear()
+                self._queued_sizes.clear()
+                self._hash_sizes.clear()
                 self._refresh_table()
                 self._update_status()
                 logger.info("Queue cleared")
@@ -1115,16 +1330,13 @@ Usernames are automatically removed from logged file paths.</p>
     @Slot()
     def _on_remove_selected(self):
         """Remove selected files from queue."""
-        selected_rows = set()
-        for item in self.file_table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = {
+            index.row() for index in self.file_table.selectionModel().selectedRows()
+        }
 
         if selected_rows:
-            # Remove in reverse order to maintain indices
-            for row in sorted(selected_rows, reverse=True):
-                if row < len(self.queued_files):
-                    del self.queued_files[row]
-            self._refresh_table()
+            for pdf in self._remove_rows(selected_rows):
+                self._normalized_paths.discard(pdf.normalized_path)
             self._update_status()
 
     @Slot()
@@ -1141,11 +1353,14 @@ Usernames are automatically removed from logged file paths.</p>
     @Slot()
     def _on_selection_changed(self):
         """Handle table selection change."""
-        selected = self.file_table.selectedItems()
-        has_selection = len(selected) > 0
+        if not self._selection_timer.isActive():
+            self._selection_timer.start()
 
-        if has_selection:
-            row = self.file_table.currentRow()
+    @Slot()
+    def _flush_selection(self):
+        """Update the move buttons for the current selection."""
+        if self.file_table.selectionModel().hasSelection():
+            row = self.file_table.currentIndex().row()
             self.move_up_btn.setEnabled(row > 0)
             self.move_down_btn.setEnabled(row < len(self.queued_files) - 1)
         else:
@@ -1155,23 +1370,30 @@ Usernames are automatically removed from logged file paths.</p>
     @Slot()
     def _on_move_up(self):
         """Move selected file up in order."""
-        row = self.file_table.currentRow()
+        row = self.file_table.currentIndex().row()
         if row > 0:
-            self.queued_files[row], self.queued_files[row - 1] = \
-                self.queued_files[row - 1], self.queued_files[row]
-            self._refresh_table()
+            self._swap_rows(row, row - 1)
             self.file_table.selectRow(row - 1)
 
     @Slot()
     def _on_move_down(self):
         """Move selected file down in order."""
-        row = self.file_table.currentRow()
-        if row < len(self.queued_files) - 1:
-            self.queued_files[row], self.queued_files[row + 1] = \
-                self.queued_files[row + 1], self.queued_files[row]
-            self._refresh_table()
+        row = self.file_table.currentIndex().row()
+        if 0 <= row < len(self.queued_files) - 1:
+            self._swap_rows(row, row + 1)
             self.file_table.selectRow(row + 1)
 
+    @Slot()
+    def _on_files_reordered(self):
+        """Handle rows moved by drag and drop in the file table."""
+        self._reindex()
+
+    @Slot(bool)
+    def _on_advanced_toggled(self, checked: bool):
+        """Build the advanced options the first time they are expanded."""
+        if checked and not self._advanced_populated:
+            self._populate_advanced_options(self.advanced_group)
+
     @Slot(int)
     def _on_sort_mode_changed(self, index: int):
         """Handle sort mode change."""
@@ -1185,12 +1407,12 @@ Usernames are automatically removed from logged file paths.</p>
             self._sort_files()
             logger.info(f"Files sorted by {self.sort_combo.currentText()}")
 
-    @Slot(int, object)
-    def _on_file_validated(self, index: int, pdf: QueuedPDF):
-        """Handle file validation complete."""
-        if index < len(self.queued_files):
-            self._refresh_table()
-            self._update_status()
+    @Slot(list)
+    def _on_files_probed(self, results: List[Tuple[int, QueuedPDF]]):
+        """Handle a batch of completed file probes."""
+        # Indexes are positions within the probed batch, not the queue
+        self._update_files([pdf for _, pdf in results])
+        self._update_status()
 
     @Slot()
     def _on_manage_allowed_dirs(self):
@@ -1203,6 +1425,8 @@ Usernames are automatically removed from logged file paths.</p>
         if dialog.exec() == QDialog.Accepted:
             settings.allowed_output_directories = dialog.get_directories()
             get_settings_manager().save()
+            # Resolve the (possibly re-created) directories afresh
+            normalize_path.cache_clear()
 
     @Slot()
     def _on_open_logs_folder(self):
@@ -1230,34 +1454,72 @@ Usernames are automatically removed from logged file paths.</p>
         if not save_path:
             return
 
-        try:
-            bundle_path = create_support_bundle(Path(save_path))
-            QMessageBox.information(
-                self,
-                "Bundle Created",
-                f"Support bundle saved to:\n{bundle_path}"
-            )
-            logger.info(f"Support bundle exported: {sanitize_path_for_log(bundle_path)}")
-        except BundleVerificationError as e:
-            QMessageBox.critical(
-                self,
-                "Bundle Error",
-                f"Failed to create support bundle:\n\n{e}"
-            )
-            logger.error(f"Support bundle verification failed: {e}")
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to create support bundle:\n\n{e}"
-            )
-            logger.exception("Support bundle creation failed")
+        # Zip the logs and reports on a worker thread; the bundle can't be
+        # stopped part way, so the progress dialog has no Cancel button
+        self.bundle_dialog = ProgressDialog(self, "Exporting Support Bundle...")
+        self.bundle_dialog.status_label.setText("Creating support bundle...")
+        self.bundle_dialog.progress_bar.setRange(0, 0)
+        self.bundle_dialog.cancel_button.hide()
+
+        self.bundle_thread = QThread()
+        self.bundle_worker = BundleWorker(Path(save_path))
+        self.bundle_worker.moveToThread(self.bundle_thread)
+
+        self.bundle_thread.started.connect(self.bundle_worker.run)
+        self.bundle_worker.finished.connect(self._on_bundle_finished, Qt.QueuedConnection)
+        self.bundle_worker.error.connect(self._on_bundle_error, Qt.QueuedConnection)
+        self.bundle_worker.finished.connect(self.bundle_thread.quit, Qt.QueuedConnection)
+        self.bundle_worker.error.connect(self.bundle_thread.quit, Qt.QueuedConnection)
+        self.bundle_thread.finished.connect(self._cleanup_bundle_thread, Qt.QueuedConnection)
+
+        self.bundle_thread.start()
+        self.bundle_dialog.show()
+
+    @Slot(object)
+    def _on_bundle_finished(self, bundle_path: Path):
+        """Handle support bundle completion."""
+        self.bundle_dialog.close()
+        QMessageBox.information(
+            self,
+            "Bundle Created",
+            f"Support bundle saved to:\n{bundle_path}"
+        )
+
+    @Slot(object)
+    def _on_bundle_error(self, error: Exception):
+        """Handle support bundle failure."""
+        from ..core.support_bundle import BundleVerificationError
+
+        self.bundle_dialog.close()
+        QMessageBox.critical(
+            self,
+            "Bundle Error" if isinstance(error, BundleVerificationError) else "Error",
+            f"Failed to create support bundle:\n\n{error}"
+        )
+
+    @Slot()
+    def _cleanup_bundle_thread(self):
+        """Clean up bundle thread and worker after completion."""
+        if self.bundle_worker:
+            self.bundle_worker.deleteLater()
+            self.bundle_worker = None
+        if self.bundle_thread:
+            self.bundle_thread.deleteLater()
+            self.bundle_thread = None
 
     @Slot()
     def _on_merge(self):
         """Handle Merge button click."""
+        # Collect mergeable and encrypted files in one pass over the queue
+        valid_files: List[QueuedPDF] = []
+        encrypted_files: List[QueuedPDF] = []
+        for f in self.queued_files:
+            if f.is_valid_for_merge:
+                valid_files.append(f)
+            if f.is_encrypted:
+                encrypted_files.append(f)
+
         # Check for valid files
-        valid_files = [f for f in self.queued_files if f.is_valid_for_merge]
         if not valid_files:
             QMessageBox.warning(
                 self,
@@ -1270,10 +1532,10 @@ Usernames are automatically removed from logged file paths.</p>
         duplicates = self._check_duplicates()
         if duplicates:
             dialog = DuplicateDialog(self, duplicates)
-            if dialog.exec() == QDialog.Accepted:
-                if not dialog.keep_duplicates:
-                    self._remove_duplicates()
-                    valid_files = [f for f in self.queued_files if f.is_valid_for_merge]
+            if dialog.exec() == DuplicateDialog.REMOVE:
+                removed = {id(f) for f in self._remove_duplicates()}
+                valid_files = [f for f in valid_files if id(f) not in removed]
+                encrypted_files = [f for f in encrypted_files if id(f) not in removed]
 
         # Determine output path
         output_folder = self.output_folder_edit.text()
@@ -1294,12 +1556,10 @@ Usernames are automatically removed from logged file paths.</p>
         # Handle existing output file
         if output_path.exists():
             dialog = OutputConflictDialog(self, str(output_path))
-            if dialog.exec() != QDialog.Accepted:
-                return
-
-            if dialog.choice == OutputConflictDialog.AUTO_RENAME:
+            choice = dialog.exec()
+            if choice == OutputConflictDialog.AUTO_RENAME:
                 output_path = find_unique_path(output_path)
-            elif dialog.choice == OutputConflictDialog.CANCEL:
+            elif choice == OutputConflictDialog.CANCEL:
                 return
             # OVERWRITE: keep same path
 
@@ -1309,16 +1569,22 @@ Usernames are automatically removed from logged file paths.</p>
         encryption_mode = self._get_encryption_mode()
 
         # Create merge service
+        from ..core.merge_service import create_merge_service
         service = create_merge_service(
-            normalize_metadata=self.normalize_metadata_check.isChecked(),
+            normalize_metadata=self._advanced_checked(
+                "normalize_metadata_check", "normalize_metadata"
+            ),
             encryption_mode=encryption_mode,
-            generate_report=self.generate_report_check.isChecked(),
-            compute_hashes=self.hash_files_check.isChecked()
+            generate_report=self._advanced_checked(
+                "generate_report_check", "generate_summary_report"
+            ),
+            compute_hashes=self._advanced_checked(
+                "hash_files_check", "enable_file_hashing"
+            )
         )
 
         # Handle single password mode - get password upfront
         if encryption_mode == EncryptionHandlingMode.SINGLE_PASSWORD:
-            encrypted_files = [f for f in self.queued_files if f.is_encrypted]
             if encrypted_files:
                 dialog = PasswordDialog(
                     self,
@@ -1333,7 +1599,7 @@ Usernames are automatically removed from logged file paths.</p>
 
         # Show progress dialog
         self.progress_dialog = ProgressDialog(self, "Merging PDFs...")
-        self.progress_dialog.cancelled.connect(self._on_merge_cancelled)
+        self.progress_dialog.cancelled.connect(self._on_merge_cancelled, Qt.DirectConnection)
 
         # Create worker thread
         self.merge_thread = QThread()
@@ -1344,15 +1610,16 @@ Usernames are automatically removed from logged file paths.</p>
         )
         self.merge_worker.moveToThread(self.merge_thread)
 
-        # Connect signals
+        # Connect signals; the worker's signals are emitted on the merge
+        # thread, so they are queued to the UI thread explicitly
         self.merge_thread.started.connect(self.merge_worker.run)
-        self.merge_worker.progress.connect(self._on_merge_progress)
-        self.merge_worker.finished.connect(self._on_merge_finished)
-        self.merge_worker.error.connect(self._on_merge_error)
+        self.merge_worker.progress.connect(self._on_merge_progress, Qt.QueuedConnection)
+        self.merge_worker.finished.connect(self._on_merge_finished, Qt.QueuedConnection)
+        self.merge_worker.error.connect(self._on_merge_error, Qt.QueuedConnection)
         # Note: Don't connect deleteLater to finished - we'll clean up manually
         # after accessing the result in _on_merge_finished
-        self.merge_worker.finished.connect(self.merge_thread.quit)
-        self.merge_thread.finished.connect(self._cleanup_merge_thread)
+        self.merge_worker.finished.connect(self.merge_thread.quit, Qt.QueuedConnection)
+        self.merge_thread.finished.connect(self._cleanup_merge_thread, Qt.QueuedConnection)
 
         # Start merge
         self.merge_thread.start()
@@ -1361,10 +1628,10 @@ Usernames are automatically removed from logged file paths.</p>
     @Slot()
     def _cleanup_merge_thread(self):
         """Clean up merge thread and worker after completion."""
-        if hasattr(self, 'merge_worker') and self.merge_worker:
+        if self.merge_worker:
             self.merge_worker.deleteLater()
             self.merge_worker = None
-        if hasattr(self, 'merge_thread') and self.merge_thread:
+        if self.merge_thread:
             self.merge_thread.deleteLater()
             self.merge_thread = None
 
@@ -1378,25 +1645,17 @@ Usernames are automatically removed from logged file paths.</p>
     @Slot(float, str, str)
     def _on_merge_progress(self, percent: float, status: str, current_file: str):
         """Handle merge progress update."""
-        if hasattr(self, 'progress_dialog'):
+        if self.progress_dialog is not None:
             self.progress_dialog.update_progress(percent, status, current_file)
 
-    @Slot(bool, int, int, int, int, int, float, str, str)
-    def _on_merge_finished(
-        self,
-        success: bool,
-        merged_count: int,
-        skipped_count: int,
-        error_count: int,
-        total_pages: int,
-        total_size_bytes: int,
-        duration_seconds: float,
-        output_path_str: str,
-        error_message: str
-    ):
+    @Slot(object)
+    def _on_merge_finished(self, result: MergeResult):
         """Handle merge completion."""
-        logger.info(f"_on_merge_finished called: success={success}, merged={merged_count}, pages={total_pages}, path={output_path_str}")
-        if hasattr(self, 'progress_dialog'):
+        success = result.success
+        output_path = result.output_path
+        output_path_str = str(output_path) if output_path else ""
+        logger.info(f"_on_merge_finished called: success={success}, merged={result.merged_count}, pages={result.total_pages}, path={output_path_str}")
+        if self.progress_dialog is not None:
             self.progress_dialog.close()
 
         # Refresh table with updated statuses
@@ -1404,27 +1663,30 @@ Usernames are automatically removed from logged file paths.</p>
         self._update_status()
 
         # Show summary dialog
-        output_size = f"{total_size_bytes / (1024*1024):.2f} MB"
-        duration = f"{duration_seconds:.1f}s"
-        output_path = Path(output_path_str) if output_path_str else None
+        output_size = f"{result.total_size_bytes / (1024*1024):.2f} MB"
+        duration = f"{result.duration_seconds:.1f}s"
 
         dialog = SummaryDialog(
             self,
             success=success,
-            merged_count=merged_count,
-            skipped_count=skipped_count,
-            error_count=error_count,
-            total_pages=total_pages,
+            merged_count=result.merged_count,
+            skipped_count=result.skipped_count,
+            error_count=result.error_count,
+            total_pages=result.total_pages,
             output_path=output_path_str,
             output_size=output_size,
             duration=duration
         )
 
+        # The dialog's requests are emitted on the UI thread, like the drop
+        # zone's, so they are connected directly
         dialog.open_folder_requested.connect(
-            lambda: self._open_folder(output_path.parent if output_path else None)
+            lambda: self._open_folder(output_path.parent if output_path else None),
+            Qt.DirectConnection
         )
         dialog.copy_path_requested.connect(
-            lambda: self._copy_to_clipboard(output_path_str)
+            lambda: self._copy_to_clipboard(output_path_str),
+            Qt.DirectConnection
         )
 
         dialog.exec()
@@ -1436,7 +1698,7 @@ Usernames are automatically removed from logged file paths.</p>
     @Slot(str)
     def _on_merge_error(self, error_message: str):
         """Handle merge error."""
-        if hasattr(self, 'progress_dialog'):
+        if self.progress_dialog is not None:
             self.progress_dialog.close()
 
         QMessageBox.critical(
@@ -1451,21 +1713,17 @@ Usernames are automatically removed from logged file paths.</p>
         if not folder_path:
             return
 
-        try:
-            if sys.platform == 'win32':
-                os.startfile(str(folder_path))
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', str(folder_path)])
-            else:
-                subprocess.run(['xdg-open', str(folder_path)])
-        except Exception as e:
-            logger.warning(f"Failed to open folder: {e}")
+        # The platform file manager is asked through Qt, without spawning
+        # and waiting on an open/xdg-open process
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder_path))):
+            logger.warning(f"Failed to open folder: {sanitize_path_for_log(folder_path)}")
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard."""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
-        self.status_bar.showMessage("Path copied to clipboard", 3000)
+        self._clipboard.setText(text)
+        # A pending status refresh would replace the note straight away
+        if not self._status_timer.isActive():
+            self.status_bar.showMessage("Path copied to clipboard", 3000)
 
     def _show_logs(self):
         """Show log viewer dialog."""
@@ -1474,8 +1732,16 @@ Usernames are automatically removed from logged file paths.</p>
 
         if log_path.exists():
             try:
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    log_content = f.read()
+                # Only the newest entries are read, however big the log is
+                with open(log_path, 'rb') as f:
+                    size = f.seek(0, os.SEEK_END)
+                    f.seek(max(0, size - LOG_VIEW_MAX_BYTES))
+                    data = f.read()
+                if size > LOG_VIEW_MAX_BYTES:
+                    # Drop the partial first line
+                    data = data[data.find(b'\n') + 1:]
+                    log_content = "(Earlier entries omitted)\n"
+                log_content += data.decode('utf-8', errors='replace')
             except Exception:
                 log_content = "(Could not read log file)"
         else:
@@ -1541,9 +1807,9 @@ Usernames are automatically removed from logged file paths.</p>
             storage_mode=storage_mode
         )
 
-        dialog.open_logs_requested.connect(self._open_logs_folder)
-        dialog.open_settings_requested.connect(self._open_settings_folder)
-        dialog.export_bundle_requested.connect(self._export_support_bundle)
+        dialog.open_logs_requested.connect(self._open_logs_folder, Qt.DirectConnection)
+        dialog.open_settings_requested.connect(self._open_settings_folder, Qt.DirectConnection)
+        dialog.export_bundle_requested.connect(self._on_export_support_bundle, Qt.DirectConnection)
 
         dialog.exec()
 
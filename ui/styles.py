@@ -0,0 +1,169 @@
+"""
+Shared Qt style sheets for PDF Consolidator.
+
+The sheets are plain module constants applied once to the QApplication,
+so Qt parses them a single time however many windows are created.
+Individual widgets opt into the special styles by setting a "role"
+dynamic property rather than carrying their own style sheet. Plain
+text colors are set through the widget palette (set_text_color), which
+involves no style sheet parsing at all.
+"""
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QWidget
+
+
+# Base look of the main window and its controls
+MAIN_WINDOW_QSS = """
+    QMainWindow {
+        background-color: #ffffff;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px;
+    }
+    QTableView {
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        gridline-color: #e9ecef;
+    }
+    QTableView::item {
+        padding: 4px;
+    }
+    QHeaderView::section {
+        background-color: #f8f9fa;
+        border: none;
+        border-bottom: 1px solid #dee2e6;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton {
+        padding: 6px 12px;
+        border: 1px solid #ced4da;
+        border-radius: 4px;
+        background-color: #ffffff;
+    }
+    QPushButton:hover {
+        background-color: #e9ecef;
+    }
+    QPushButton:disabled {
+        color: #adb5bd;
+    }
+    QLineEdit {
+        padding: 6px;
+        border: 1px solid #ced4da;
+        border-radius: 4px;
+    }
+    QComboBox {
+        padding: 6px;
+        border: 1px solid #ced4da;
+        border-radius: 4px;
+    }
+"""
+
+# Primary action button (role="primary"), e.g. Merge PDFs
+MERGE_BUTTON_QSS = """
+    QPushButton[role="primary"] {
+        background-color: #0d6efd;
+        color: white;
+        font-weight: bold;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton[role="primary"]:hover {
+        background-color: #0b5ed7;
+    }
+    QPushButton[role="primary"]:disabled {
+        background-color: #6c757d;
+    }
+"""
+
+# Window title label (role="title")
+TITLE_QSS = """
+    QLabel[role="title"] {
+        font-size: 24px;
+        font-weight: bold;
+        color: #212529;
+    }
+"""
+
+# Drop zone labels (role="drop-title" / "drop-hint"); the
+# frame itself switches between DropZone's idle and hover sheets
+DROP_ZONE_QSS = """
+    DropZone QLabel {
+        border: none;
+        background: transparent;
+    }
+    QLabel[role="drop-title"] {
+        font-size: 16px;
+        font-weight: bold;
+        color: #495057;
+    }
+    QLabel[role="drop-hint"] {
+        font-size: 12px;
+        color: #6c757d;
+    }
+"""
+
+# Labels, frames and buttons shared by the dialogs
+DIALOG_QSS = """
+    QLabel[role="heading"] {
+        font-weight: bold;
+    }
+    QLabel[role="dialog-title"] {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QLabel[role="result-success"], QLabel[role="result-failure"] {
+        font-size: 18px;
+        font-weight: bold;
+        color: #28a745;
+    }
+    QLabel[role="result-failure"] {
+        color: #dc3545;
+    }
+    QFrame[role="path-box"] {
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 8px;
+    }
+    QLabel[role="about-description"] {
+        color: #555;
+        margin: 4px 0;
+    }
+    QLabel[role="privacy-note"] {
+        color: #2e7d32;
+        padding: 6px;
+        background: #e8f5e9;
+        border-radius: 4px;
+    }
+    QPushButton[role="emphasis"] {
+        font-weight: bold;
+    }
+"""
+
+# Text colors for set_text_color and inline rich text: secondary details,
+# items listed under them, the app version, and file paths
+MUTED_TEXT_COLOR = "#666"
+FAINT_TEXT_COLOR = "#999"
+VERSION_TEXT_COLOR = "#6c757d"
+PATH_TEXT_COLOR = "#495057"
+
+# Everything above, as set on the QApplication
+APP_QSS = MAIN_WINDOW_QSS + MERGE_BUTTON_QSS + TITLE_QSS + DROP_ZONE_QSS + DIALOG_QSS
+
+
+def set_text_color(widget: QWidget, color: str):
+    """Color a widget's text through its palette instead of a style sheet."""
+    palette = widget.palette()
+    palette.setColor(QPalette.WindowText, QColor(color))
+    widget.setPalette(palette)
@@ -1,18 +1,193 @@
 """
 Reusable UI widgets for PDF Consolidator.
 """
+import html
+import os
+import stat
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
-from PySide6.QtCore import Qt, Signal, QMimeData
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QPainter, QColor, QPen, QFont
+from PySide6.QtCore import (
+    Qt, Signal, QMimeData, QObject, QRunnable, QStringListModel, QThreadPool
+)
+from PySide6.QtGui import (
+    QDragEnterEvent, QDropEvent, QPainter, QColor, QPen, QFont, QImage, QPixmap
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QDialog, QDialogButtonBox, QTextEdit, QLineEdit, QFormLayout,
+    QDialog, QDialogButtonBox, QPlainTextEdit, QLineEdit, QGridLayout,
     QMessageBox, QProgressBar, QFrame, QSizePolicy, QRadioButton,
-    QButtonGroup, QGroupBox, QListWidget, QListWidgetItem, QCheckBox
+    QButtonGroup, QGroupBox, QListView, QCheckBox
 )
 
+from .styles import (
+    FAINT_TEXT_COLOR, MUTED_TEXT_COLOR, PATH_TEXT_COLOR, set_text_color
+)
+
+
+# Dropped paths sharing a folder from which that folder is listed once
+# rather than stat'ing each path
+DROP_SCANDIR_MIN_PATHS = 32
+
+
+# Merge summary figures, filled in with str.format
+_SUMMARY_STATS_HTML = """
+        <table style="margin-left: 10px;">
+            <tr><td style="padding-right: 20px;">Files merged:</td><td><b>{merged}</b></td></tr>
+            <tr><td>Files skipped:</td><td>{skipped}</td></tr>
+            <tr><td>Errors:</td><td>{errors}</td></tr>
+            <tr><td>Total pages:</td><td>{pages}</td></tr>
+            <tr><td>Output size:</td><td>{size}</td></tr>
+            <tr><td>Duration:</td><td>{duration}</td></tr>
+        </table>
+        """
+
+
+# Emoji glyphs rendered to pixmaps, keyed by (glyph, size in pixels).
+# Filled on first use since a QPixmap needs the QApplication to exist
+_ICON_CACHE: Dict[tuple, QPixmap] = {}
+
+
+def _emoji_pixmap(glyph: str, size: int) -> QPixmap:
+    """
+    Get an emoji glyph drawn once into a size x size pixmap.
+
+    Labels showing the pixmap skip shaping the emoji's grapheme cluster
+    on every paint, which a text label does.
+    """
+    key = (glyph, size)
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is None:
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        font = QFont()
+        font.setPixelSize(size * 4 // 5)
+        painter.setFont(font)
+        painter.drawText(image.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        pixmap = _ICON_CACHE[key] = QPixmap.fromImage(image)
+    return pixmap
+
+
+def _icon_header(glyph: str, text: str, role: str, size: int) -> QHBoxLayout:
+    """Build a dialog header row: the glyph's pixmap, then the text label."""
+    row = QHBoxLayout()
+    row.setSpacing(8)
+    icon = QLabel()
+    icon.setPixmap(_emoji_pixmap(glyph, size))
+    row.addWidget(icon)
+    label = QLabel(text)
+    label.setProperty("role", role)
+    row.addWidget(label, 1)
+    return row
+
+
+def _add_grid_row(grid: QGridLayout, row: int, label: str, field: QWidget):
+    """Add a label/field pair as one row of a two-column grid."""
+    # Next to wrapped text the label stays on the first line, as in a form
+    wraps = isinstance(field, QLabel) and field.wordWrap()
+    grid.addWidget(
+        QLabel(label), row, 0, Qt.AlignLeft | (Qt.AlignTop if wraps else Qt.AlignVCenter)
+    )
+    grid.addWidget(field, row, 1)
+
+
+def _elide_text(widget: QWidget, text: str, mode: Qt.TextElideMode, chars: int) -> str:
+    """
+    Elide text to about chars average characters of the widget's font.
+
+    The budget is in pixels (QFontMetrics.elidedText), so it holds for
+    proportional fonts and works before the widget has been laid out.
+    """
+    metrics = widget.fontMetrics()
+    return metrics.elidedText(text, mode, metrics.averageCharWidth() * chars)
+
+
+class DropClassifierSignals(QObject):
+    """Signals of a DropClassifier (QRunnable itself can't emit)."""
+
+    classified = Signal(list, list)  # file Paths, folder Paths
+
+
+class DropClassifier(QRunnable):
+    """
+    Runnable sorting dropped paths into files and folders off the UI thread.
+
+    Each path costs a stat, which can take a noticeable time per file on
+    network shares, so when many paths come from one folder that folder
+    is listed once with os.scandir instead. Paths that no longer exist
+    are left out.
+    """
+
+    def __init__(self, paths: List[Path], parent: Optional[QObject] = None):
+        super().__init__()
+        self.paths = paths
+        self.signals = DropClassifierSignals(parent)
+        self.setAutoDelete(True)
+
+    def run(self):
+        """Classify the paths and report both lists."""
+        by_parent: Dict[Path, List[Path]] = defaultdict(list)
+        for path in self.paths:
+            by_parent[path.parent].append(path)
+
+        # Results per path, so both lists keep the order of the drop
+        is_dir: Dict[Path, bool] = {}
+        for parent, paths in by_parent.items():
+            if len(paths) >= DROP_SCANDIR_MIN_PATHS:
+                self._classify_from_listing(parent, paths, is_dir)
+            else:
+                for path in paths:
+                    self._classify_with_stat(path, is_dir)
+
+        files = [path for path in self.paths if is_dir.get(path) is False]
+        folders = [path for path in self.paths if is_dir.get(path)]
+        self.signals.classified.emit(files, folders)
+
+    @staticmethod
+    def _classify_with_stat(path: Path, is_dir: Dict[Path, bool]):
+        """Classify one path with a single stat."""
+        # One stat tells both whether it exists and what it is
+        try:
+            mode = path.stat().st_mode
+        except OSError:
+            return
+        if stat.S_ISDIR(mode):
+            is_dir[path] = True
+        elif stat.S_ISREG(mode):
+            is_dir[path] = False
+
+    @classmethod
+    def _classify_from_listing(
+        cls,
+        parent: Path,
+        paths: List[Path],
+        is_dir: Dict[Path, bool]
+    ):
+        """Classify paths of one folder from a single listing of it."""
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            for path in paths:
+                cls._classify_with_stat(path, is_dir)
+            return
+        for path in paths:
+            entry = entries.get(path.name)
+            if entry is None:
+                continue
+            # The listing's file type is used; only symlinks (followed, as
+            # stat does) cost a call
+            try:
+                if entry.is_dir():
+                    is_dir[path] = True
+                elif entry.is_file():
+                    is_dir[path] = False
+            except OSError:
+                continue
+
 
 class DropZone(QFrame):
     """
@@ -21,10 +196,30 @@ class DropZone(QFrame):
     Emits signals when files or folders are dropped.
     """
 
-    files_dropped = Signal(list)  # List of file paths
-    folders_dropped = Signal(list)  # List of folder paths
+    files_dropped = Signal(list)  # List of file Paths
+    folders_dropped = Signal(list)  # List of folder Paths
     clicked = Signal()  # Emitted when zone is clicked
 
+    # Frame look while idle and while a drag hovers over the zone
+    _STYLE_IDLE = """
+        DropZone {
+            background-color: #f8f9fa;
+            border: 2px dashed #dee2e6;
+            border-radius: 8px;
+        }
+        DropZone:hover {
+            border-color: #6c757d;
+            background-color: #e9ecef;
+        }
+    """
+    _STYLE_HOVER = """
+        DropZone {
+            background-color: #e7f5ff;
+            border: 2px dashed #339af0;
+            border-radius: 8px;
+        }
+    """
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setAcceptDrops(True)
@@ -35,47 +230,26 @@ class DropZone(QFrame):
 
     def _setup_ui(self):
         """Set up the drop zone appearance."""
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #f8f9fa;
-                border: 2px dashed #dee2e6;
-                border-radius: 8px;
-            }
-            DropZone:hover {
-                border-color: #6c757d;
-                background-color: #e9ecef;
-            }
-        """)
+        self.setStyleSheet(self._STYLE_IDLE)
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
 
         # Icon/label
-        self.icon_label = QLabel("📄")
-        self.icon_label.setStyleSheet("font-size: 32px; border: none; background: transparent;")
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(_emoji_pixmap("📄", 32))
         self.icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.icon_label)
 
         # Main text
         self.main_label = QLabel("Drop PDF files here")
-        self.main_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #495057;
-            border: none;
-            background: transparent;
-        """)
+        self.main_label.setProperty("role", "drop-title")
         self.main_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.main_label)
 
         # Sub text
         self.sub_label = QLabel("or click to browse")
-        self.sub_label.setStyleSheet("""
-            font-size: 12px;
-            color: #6c757d;
-            border: none;
-            background: transparent;
-        """)
+        self.sub_label.setProperty("role", "drop-hint")
         self.sub_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.sub_label)
 
@@ -90,43 +264,42 @@ class DropZone(QFrame):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
             self._dragging = True
-            self.setStyleSheet("""
-                DropZone {
-                    background-color: #e7f5ff;
-                    border: 2px dashed #339af0;
-                    border-radius: 8px;
-                }
-            """)
+            self.setStyleSheet(self._STYLE_HOVER)
             self.main_label.setText("Release to add files")
 
-    def dragLeaveEvent(self, event):
-        """Handle drag leave events."""
+    def _apply_idle_style(self):
+        """Return to the idle look once a drag is over."""
         self._dragging = False
-        self._setup_ui()
+        self.setStyleSheet(self._STYLE_IDLE)
         self.main_label.setText("Drop PDF files here")
 
+    def dragLeaveEvent(self, event):
+        """Handle drag leave events."""
+        self._apply_idle_style()
+
     def dropEvent(self, event: QDropEvent):
         """Handle drop events."""
-        self._dragging = False
-        self._setup_ui()
-        self.main_label.setText("Drop PDF files here")
-
-        files: List[Path] = []
-        folders: List[Path] = []
-
-        for url in event.mimeData().urls():
-            path = Path(url.toLocalFile())
-            if path.is_dir():
-                folders.append(path)
-            elif path.is_file():
-                files.append(path)
-
+        # Accept before anything else so the drag source is released, and
+        # look at the paths on the thread pool; the signals follow once
+        # that's done
+        event.acceptProposedAction()
+        self._apply_idle_style()
+
+        paths = [Path(url.toLocalFile()) for url in event.mimeData().urls()]
+        if not paths:
+            return
+        classifier = DropClassifier(paths, parent=self)
+        signals = classifier.signals
+        signals.classified.connect(self._on_drop_classified)
+        signals.classified.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(classifier)
+
+    def _on_drop_classified(self, files: List[Path], folders: List[Path]):
+        """Emit the dropped files and folders once they are sorted out."""
         if files:
-            self.files_dropped.emit([str(f) for f in files])
+            self.files_dropped.emit(files)
         if folders:
-            self.folders_dropped.emit([str(f) for f in folders])
-
-        event.acceptProposedAction()
+            self.folders_dropped.emit(folders)
 
 
 class ProgressDialog(QDialog):
@@ -153,12 +326,12 @@ class ProgressDialog(QDialog):
 
         # Status label
         self.status_label = QLabel("Preparing...")
-        self.status_label.setStyleSheet("font-weight: bold;")
+        self.status_label.setProperty("role", "heading")
         layout.addWidget(self.status_label)
 
         # File label
         self.file_label = QLabel("")
-        self.file_label.setStyleSheet("color: #666;")
+        set_text_color(self.file_label, MUTED_TEXT_COLOR)
         layout.addWidget(self.file_label)
 
         # Progress bar
@@ -186,10 +359,10 @@ class ProgressDialog(QDialog):
         self.progress_bar.setValue(int(percent))
         self.status_label.setText(status)
         if current_file:
-            # Truncate long filenames
-            if len(current_file) > 50:
-                current_file = "..." + current_file[-47:]
-            self.file_label.setText(current_file)
+            # Elide long filenames from the left, keeping the end visible
+            self.file_label.setText(
+                _elide_text(self.file_label, current_file, Qt.ElideLeft, 50)
+            )
 
     def set_complete(self):
         """Mark operation as complete."""
@@ -250,31 +423,23 @@ class SummaryDialog(QDialog):
         if success:
             icon = "✅"
             title = "Merge Successful"
-            header_color = "#28a745"
+            header_role = "result-success"
         else:
             icon = "❌"
             title = "Merge Failed"
-            header_color = "#dc3545"
-
-        header = QLabel(f"{icon}  {title}")
-        header.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: bold;
-            color: {header_color};
-        """)
-        layout.addWidget(header)
+            header_role = "result-failure"
+
+        layout.addLayout(_icon_header(icon, title, header_role, 24))
 
         # Stats
-        stats_text = f"""
-        <table style="margin-left: 10px;">
-            <tr><td style="padding-right: 20px;">Files merged:</td><td><b>{merged_count}</b></td></tr>
-            <tr><td>Files skipped:</td><td>{skipped_count}</td></tr>
-            <tr><td>Errors:</td><td>{error_count}</td></tr>
-            <tr><td>Total pages:</td><td>{total_pages}</td></tr>
-            <tr><td>Output size:</td><td>{output_size}</td></tr>
-            <tr><td>Duration:</td><td>{duration}</td></tr>
-        </table>
-        """
+        stats_text = _SUMMARY_STATS_HTML.format(
+            merged=merged_count,
+            skipped=skipped_count,
+            errors=error_count,
+            pages=total_pages,
+            size=output_size,
+            duration=duration
+        )
         stats_label = QLabel(stats_text)
         stats_label.setTextFormat(Qt.RichText)
         layout.addWidget(stats_label)
@@ -282,28 +447,19 @@ class SummaryDialog(QDialog):
         # Output path
         if output_path:
             path_group = QFrame()
-            path_group.setStyleSheet("""
-                QFrame {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            path_group.setProperty("role", "path-box")
             path_layout = QVBoxLayout(path_group)
             path_layout.setContentsMargins(8, 8, 8, 8)
 
             path_title = QLabel("Output file:")
-            path_title.setStyleSheet("font-weight: bold; border: none; background: transparent;")
+            path_title.setProperty("role", "heading")
             path_layout.addWidget(path_title)
 
-            # Truncate path for display
-            display_path = output_path
-            if len(display_path) > 60:
-                display_path = "..." + display_path[-57:]
+            # Elide the middle of long paths, keeping drive and file name
+            display_path = _elide_text(path_group, output_path, Qt.ElideMiddle, 60)
 
             path_value = QLabel(display_path)
-            path_value.setStyleSheet("color: #495057; border: none; background: transparent;")
+            set_text_color(path_value, PATH_TEXT_COLOR)
             path_value.setWordWrap(True)
             path_layout.addWidget(path_value)
 
@@ -367,24 +523,23 @@ class PasswordDialog(QDialog):
         layout.setSpacing(12)
 
         # Header
-        header = QLabel("🔒  This PDF is password protected")
-        header.setStyleSheet("font-weight: bold;")
-        layout.addWidget(header)
+        layout.addLayout(_icon_header("🔒", "This PDF is password protected", "heading", 16))
 
         # Filename
         if filename:
             file_label = QLabel(f"File: {filename}")
-            file_label.setStyleSheet("color: #666;")
+            set_text_color(file_label, MUTED_TEXT_COLOR)
             file_label.setWordWrap(True)
             layout.addWidget(file_label)
 
         # Password input
-        form = QFormLayout()
+        grid = QGridLayout()
+        grid.setColumnStretch(1, 1)
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setPlaceholderText("Enter password")
-        form.addRow("Password:", self.password_input)
-        layout.addLayout(form)
+        _add_grid_row(grid, 0, "Password:", self.password_input)
+        layout.addLayout(grid)
 
         # Use for all checkbox
         if show_use_for_all:
@@ -452,8 +607,9 @@ class LogViewerDialog(QDialog):
         """Set up the dialog UI."""
         layout = QVBoxLayout(self)
 
-        # Log text area
-        self.log_text = QTextEdit()
+        # Log text area; QPlainTextEdit lays out plain lines far faster
+        # than QTextEdit's rich text document
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 9))
         self.log_text.setPlainText(self.log_content)
@@ -462,9 +618,9 @@ class LogViewerDialog(QDialog):
         # Buttons
         button_layout = QHBoxLayout()
 
-        copy_btn = QPushButton("Copy to Clipboard")
-        copy_btn.clicked.connect(self._on_copy)
-        button_layout.addWidget(copy_btn)
+        self.copy_btn = QPushButton("Copy to Clipboard")
+        self.copy_btn.clicked.connect(self._on_copy)
+        button_layout.addWidget(self.copy_btn)
 
         button_layout.addStretch()
 
@@ -476,10 +632,15 @@ class LogViewerDialog(QDialog):
 
     def _on_copy(self):
         """Copy logs to clipboard."""
-        from PySide6.QtWidgets import QApplication
+        from PySide6.QtWidgets import QApplication, QToolTip
         clipboard = QApplication.clipboard()
         clipboard.setText(self.log_content)
-        QMessageBox.information(self, "Copied", "Logs copied to clipboard.")
+        # Confirm with a tooltip at the button rather than a modal box
+        QToolTip.showText(
+            self.copy_btn.mapToGlobal(self.copy_btn.rect().bottomLeft()),
+            "Logs copied to clipboard.",
+            self.copy_btn
+        )
 
     def set_log_content(self, content: str):
         """Update log content."""
@@ -490,8 +651,15 @@ class LogViewerDialog(QDialog):
 class DuplicateDialog(QDialog):
     """
     Dialog for handling duplicate files.
+
+    exec() returns the choice: REMOVE, KEEP, or CANCEL if the dialog was
+    closed, which leaves the duplicates in place as well.
     """
 
+    REMOVE = 2
+    KEEP = 1
+    CANCEL = 0
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -502,7 +670,6 @@ class DuplicateDialog(QDialog):
         self.setModal(True)
         self.setMinimumWidth(400)
         self.duplicates = duplicates or []
-        self.keep_duplicates = False
         self._setup_ui()
 
     def _setup_ui(self):
@@ -511,9 +678,9 @@ class DuplicateDialog(QDialog):
         layout.setSpacing(12)
 
         # Header
-        header = QLabel(f"⚠️  {len(self.duplicates)} duplicate file(s) detected")
-        header.setStyleSheet("font-weight: bold;")
-        layout.addWidget(header)
+        layout.addLayout(_icon_header(
+            "⚠️", f"{len(self.duplicates)} duplicate file(s) detected", "heading", 16
+        ))
 
         # Description
         desc = QLabel(
@@ -523,19 +690,20 @@ class DuplicateDialog(QDialog):
         desc.setWordWrap(True)
         layout.addWidget(desc)
 
-        # File list
+        # File list, as a single rich text label however long it is
         if len(self.duplicates) <= 5:
-            for dup in self.duplicates:
-                label = QLabel(f"  • {dup}")
-                label.setStyleSheet("color: #666;")
-                layout.addWidget(label)
+            lines = [
+                f'<span style="color:{MUTED_TEXT_COLOR}">&nbsp;&nbsp;• {html.escape(dup)}</span>'
+                for dup in self.duplicates
+            ]
         else:
-            label = QLabel(f"  • {self.duplicates[0]}")
-            label.setStyleSheet("color: #666;")
-            layout.addWidget(label)
-            more = QLabel(f"  ... and {len(self.duplicates) - 1} more")
-            more.setStyleSheet("color: #999;")
-            layout.addWidget(more)
+            lines = [
+                f'<span style="color:{MUTED_TEXT_COLOR}">&nbsp;&nbsp;• {html.escape(self.duplicates[0])}</span>',
+                f'<span style="color:{FAINT_TEXT_COLOR}">&nbsp;&nbsp;... and {len(self.duplicates) - 1} more</span>',
+            ]
+        file_list = QLabel("<br>".join(lines))
+        file_list.setTextFormat(Qt.RichText)
+        layout.addWidget(file_list)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -553,18 +721,18 @@ class DuplicateDialog(QDialog):
 
     def _on_keep(self):
         """Keep duplicates."""
-        self.keep_duplicates = True
-        self.accept()
+        self.done(self.KEEP)
 
     def _on_remove(self):
         """Remove duplicates."""
-        self.keep_duplicates = False
-        self.accept()
+        self.done(self.REMOVE)
 
 
 class OutputConflictDialog(QDialog):
     """
     Dialog for handling output file conflicts.
+
+    exec() returns the choice: OVERWRITE, AUTO_RENAME or CANCEL.
     """
 
     OVERWRITE = 1
@@ -580,7 +748,6 @@ class OutputConflictDialog(QDialog):
         self.setWindowTitle("Output File Exists")
         self.setModal(True)
         self.setMinimumWidth(450)
-        self.choice = self.CANCEL
         self._setup_ui(output_path)
 
     def _setup_ui(self, output_path: str):
@@ -589,14 +756,13 @@ class OutputConflictDialog(QDialog):
         layout.setSpacing(12)
 
         # Header
-        header = QLabel("⚠️  Output file already exists")
-        header.setStyleSheet("font-weight: bold;")
-        layout.addWidget(header)
+        layout.addLayout(_icon_header("⚠️", "Output file already exists", "heading", 16))
 
         # Path display
         if output_path:
-            path_label = QLabel(f"File: {Path(output_path).name}")
-            path_label.setStyleSheet("color: #666;")
+            name = _elide_text(self, os.path.basename(output_path), Qt.ElideMiddle, 60)
+            path_label = QLabel(f"File: {name}")
+            set_text_color(path_label, MUTED_TEXT_COLOR)
             layout.addWidget(path_label)
 
         # Description
@@ -623,13 +789,11 @@ class OutputConflictDialog(QDialog):
 
     def _on_overwrite(self):
         """Handle overwrite choice."""
-        self.choice = self.OVERWRITE
-        self.accept()
+        self.done(self.OVERWRITE)
 
     def _on_rename(self):
         """Handle auto-rename choice."""
-        self.choice = self.AUTO_RENAME
-        self.accept()
+        self.done(self.AUTO_RENAME)
 
 
 class AllowedDirectoriesDialog(QDialog):
@@ -646,7 +810,8 @@ class AllowedDirectoriesDialog(QDialog):
         self.setWindowTitle("Allowed Output Directories")
         self.setModal(True)
         self.setMinimumSize(500, 300)
-        self.directories = list(directories) if directories else []
+        # The list view's model holds the directories being edited
+        self.model = QStringListModel(list(directories) if directories else [], self)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -662,11 +827,11 @@ class AllowedDirectoriesDialog(QDialog):
         desc.setWordWrap(True)
         layout.addWidget(desc)
 
-        # List widget
-        self.list_widget = QListWidget()
-        for d in self.directories:
-            self.list_widget.addItem(d)
-        layout.addWidget(self.list_widget)
+        # Directory list
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setEditTriggers(QListView.NoEditTriggers)
+        layout.addWidget(self.list_view)
 
         # Add/Remove buttons
         btn_row = QHBoxLayout()
@@ -697,20 +862,20 @@ class AllowedDirectoriesDialog(QDialog):
             self,
             "Select Allowed Directory"
         )
-        if folder and folder not in self.directories:
-            self.directories.append(folder)
-            self.list_widget.addItem(folder)
+        if folder and folder not in self.model.stringList():
+            row = self.model.rowCount()
+            self.model.insertRow(row)
+            self.model.setData(self.model.index(row), folder)
 
     def _on_remove(self):
         """Remove selected directory."""
-        current = self.list_widget.currentRow()
+        current = self.list_view.currentIndex().row()
         if current >= 0:
-            self.directories.pop(current)
-            self.list_widget.takeItem(current)
+            self.model.removeRow(current)
 
     def get_directories(self) -> List[str]:
         """Get the list of allowed directories."""
-        return self.directories
+        return self.model.stringList()
 
 
 class SupportBundleDialog(QDialog):
@@ -736,9 +901,7 @@ class SupportBundleDialog(QDialog):
         layout.setSpacing(12)
 
         # Header
-        header = QLabel("📦  Create Support Bundle")
-        header.setStyleSheet("font-size: 16px; font-weight: bold;")
-        layout.addWidget(header)
+        layout.addLayout(_icon_header("📦", "Create Support Bundle", "dialog-title", 20))
 
         # Description
         desc = QLabel(
@@ -751,7 +914,7 @@ class SupportBundleDialog(QDialog):
             "  • Passwords or sensitive data\n"
             "  • Unsanitized file paths"
         )
-        desc.setStyleSheet("color: #666;")
+        set_text_color(desc, MUTED_TEXT_COLOR)
         layout.addWidget(desc)
 
         # Buttons
@@ -825,41 +988,43 @@ class AboutDialog(QDialog):
         )
         desc.setAlignment(Qt.AlignCenter)
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #555; margin: 4px 0;")
+        desc.setProperty("role", "about-description")
         layout.addWidget(desc)
 
         # Build info section
         build_group = QGroupBox("Build Information")
-        build_layout = QFormLayout(build_group)
+        build_layout = QGridLayout(build_group)
         build_layout.setSpacing(6)
+        build_layout.setColumnStretch(1, 1)
 
         build_time_label = QLabel(f"<code>{self.build_time}</code>")
         build_time_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        build_layout.addRow("Build time:", build_time_label)
+        _add_grid_row(build_layout, 0, "Build time:", build_time_label)
 
         fingerprint_label = QLabel(f"<code>{self.build_fingerprint}</code>")
         fingerprint_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        build_layout.addRow("Fingerprint:", fingerprint_label)
+        _add_grid_row(build_layout, 1, "Fingerprint:", fingerprint_label)
 
         dist_label = QLabel(f"<code>{self.distribution_mode}</code>")
-        build_layout.addRow("Distribution:", dist_label)
+        _add_grid_row(build_layout, 2, "Distribution:", dist_label)
 
         layout.addWidget(build_group)
 
         # Storage info section
         storage_group = QGroupBox(f"Local Storage ({self.storage_mode} mode)")
-        storage_layout = QFormLayout(storage_group)
+        storage_layout = QGridLayout(storage_group)
         storage_layout.setSpacing(6)
+        storage_layout.setColumnStretch(1, 1)
 
         settings_label = QLabel(f"<code>{self.settings_path}</code>")
         settings_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         settings_label.setWordWrap(True)
-        storage_layout.addRow("Settings:", settings_label)
+        _add_grid_row(storage_layout, 0, "Settings:", settings_label)
 
         logs_label = QLabel(f"<code>{self.logs_path}</code>")
         logs_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         logs_label.setWordWrap(True)
-        storage_layout.addRow("Logs:", logs_label)
+        _add_grid_row(storage_layout, 1, "Logs:", logs_label)
 
         layout.addWidget(storage_group)
 
@@ -869,7 +1034,7 @@ class AboutDialog(QDialog):
             "Passwords are never saved."
         )
         privacy.setWordWrap(True)
-        privacy.setStyleSheet("color: #2e7d32; padding: 6px; background: #e8f5e9; border-radius: 4px;")
+        privacy.setProperty("role", "privacy-note")
         layout.addWidget(privacy)
 
         # Action buttons
@@ -895,7 +1060,7 @@ class AboutDialog(QDialog):
         btn_row2.addWidget(copy_info_btn)
 
         bundle_btn = QPushButton("Export Support Bundle...")
-        bundle_btn.setStyleSheet("font-weight: bold;")
+        bundle_btn.setProperty("role", "emphasis")
         bundle_btn.clicked.connect(self._on_export_bundle)
         btn_row2.addWidget(bundle_btn)
 
@@ -906,7 +1071,7 @@ class AboutDialog(QDialog):
             "No PDFs or passwords.</small>"
         )
         bundle_note.setWordWrap(True)
-        bundle_note.setStyleSheet("color: #666;")
+        set_text_color(bundle_note, MUTED_TEXT_COLOR)
         actions_layout.addWidget(bundle_note)
 
         layout.addWidget(actions_group)